@@ -8,6 +8,7 @@ import asyncio
 import json
 import time
 import uuid
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Callable, Optional
 
@@ -17,6 +18,7 @@ import os
 
 from core.portfolio import Portfolio
 from core.db import get_db
+from core.timeutil import iso_z_now
 
 # Use OLLAMA_HOST env var if set (e.g. timone uses port 8081)
 _ollama_host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
@@ -38,7 +40,12 @@ MAX_HISTORY_PAIRS = 10  # = 20 messages
 
 def _utcnow() -> str:
     """Return current UTC time as ISO 8601 string with Z suffix."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return iso_z_now()
+
+
+def _prices_hash(prices: dict) -> int:
+    """Cheap fingerprint of a price snapshot (symbol + price to 4 decimals)."""
+    return hash(tuple((s, round(p["price"], 4)) for s, p in sorted(prices.items())))
 
 
 BASE_SYSTEM_PROMPT = """You are PhantomEx, an AI crypto portfolio manager. Your job is to grow the total value of a mixed portfolio of cash and crypto assets.
@@ -160,6 +167,7 @@ class Agent:
         self.risk_profile = risk_profile      # "aggressive" | "neutral" | "safe"
         self.max_duration = max_duration      # seconds; None = run forever
         self._last_run_at: float = 0.0        # unix timestamp of last cycle
+        self._last_prices_hash: Optional[int] = None  # fingerprint of prices at last cycle
         self.started_at: Optional[float] = None  # set on first run_once()
         self.on_trade = on_trade
         self.on_decision = on_decision
@@ -170,6 +178,19 @@ class Agent:
         self._pending_decision: Optional[dict] = None
         self.last_thought: Optional[dict] = None  # last model decision + reasoning
         self._chat_history: list[dict] = []  # rolling conversation history (user+assistant pairs)
+        # Running buy/sell/hold counts, seeded once from DB and kept current by
+        # execute_decision so session saves don't re-scan the full trade history
+        self.side_counts: Counter = Counter()
+        with get_db() as conn:
+            for row in conn.execute(
+                "SELECT side, COUNT(*) AS n FROM trades WHERE agent_id = ? GROUP BY side",
+                (agent_id,),
+            ):
+                self.side_counts[row["side"]] = row["n"]
+
+    def due(self, now: float) -> bool:
+        """Cheap predicate for the price-tick fan-out: is a cycle worth spawning?"""
+        return not self._stopped and now - self._last_run_at >= self.trade_interval
 
     async def think(self, prices: dict) -> dict:
         """Ask the model what to do given current market conditions.
@@ -221,6 +242,7 @@ class Agent:
                    VALUES (?, ?, 'hold', 0, 0, 0, ?, 'paper', ?)""",
                 (self.agent_id, "", reasoning, timestamp),
             )
+        self.side_counts["hold"] += 1
 
     async def execute_decision(self, decision: dict, prices: dict) -> Optional[dict]:
         """Execute a trade decision. Returns trade record or None if hold."""
@@ -272,6 +294,7 @@ class Agent:
                 reasoning=reasoning,
                 mode="paper",
             )
+            self.side_counts[action] += 1
             if self.on_trade:
                 await self.on_trade(self.agent_id, trade)
             return trade
@@ -310,7 +333,15 @@ class Agent:
                 await self.on_thought(self.agent_id)  # broadcast stopped state
             return
 
+        # Prices haven't moved since the last cycle — the model would see the
+        # exact same context, so skip the LLM round trip until the market does.
+        # _last_run_at is left alone so the next changed tick runs immediately.
+        h = _prices_hash(prices)
+        if h == self._last_prices_hash:
+            return
+
         self._last_run_at = now
+        self._last_prices_hash = h
         try:
             decision = await self.think(prices)
         except Exception as e:
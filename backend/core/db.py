@@ -5,16 +5,31 @@ Handles agents, portfolios, trades, and sessions.
 
 import sqlite3
 import os
+import threading
 from contextlib import contextmanager
 
 DB_PATH = os.environ.get("PHANTOMEX_DB", "data/phantomex.db")
 
+# One connection per thread, opened lazily and kept for the thread's lifetime.
+# Reusing the connection keeps sqlite3's internal prepared-statement cache warm
+# (hot SQL like the equity-snapshot INSERT is parsed once, not per call) and
+# avoids paying connection setup + pragma configuration on every get_db().
+_local = threading.local()
+
 
 def get_connection() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        return conn
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")    # WAL survives crashes without per-commit fsync
+    conn.execute("PRAGMA mmap_size=268435456")   # 256 MB — read pages via mmap
+    conn.execute("PRAGMA cache_size=-65536")     # 64 MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    _local.conn = conn
     return conn
 
 
@@ -27,8 +42,6 @@ def get_db():
     except Exception:
         conn.rollback()
         raise
-    finally:
-        conn.close()
 
 
 def init_db():
@@ -111,6 +124,13 @@ def init_db():
                 saved_at     TEXT NOT NULL
             );
 
+            CREATE TABLE IF NOT EXISTS session_blobs (
+                session_id  INTEGER NOT NULL REFERENCES saved_sessions(id),
+                kind        TEXT NOT NULL,
+                payload     BLOB NOT NULL,
+                PRIMARY KEY (session_id, kind)
+            );
+
             CREATE TABLE IF NOT EXISTS equity_snapshots (
                 id          INTEGER PRIMARY KEY AUTOINCREMENT,
                 agent_id    TEXT NOT NULL REFERENCES agents(id),
@@ -121,6 +141,12 @@ def init_db():
 
             CREATE INDEX IF NOT EXISTS idx_equity_agent_ts
                 ON equity_snapshots(agent_id, timestamp);
+
+            CREATE INDEX IF NOT EXISTS idx_trades_agent_ts
+                ON trades(agent_id, timestamp DESC);
+
+            CREATE INDEX IF NOT EXISTS idx_trades_ts
+                ON trades(timestamp DESC);
         """)
         # Migrations for existing databases
         conn.executescript("""
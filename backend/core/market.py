@@ -10,6 +10,7 @@ import os
 from datetime import datetime, timezone
 from typing import Callable, Optional
 from core.db import get_db
+from core.timeutil import iso_z_now
 
 COINGECKO_BASE = "https://api.coingecko.com/api/v3"
 
@@ -43,15 +44,26 @@ class MarketFeed:
         self.subscribers: list[Callable] = []
         self._running = False
         self._prices: dict[str, dict] = {}
+        # Bumped whenever a new snapshot is installed — downstream caches key
+        # on this instead of comparing price dicts
+        self.tick_id: int = 0
 
     def subscribe(self, callback: Callable):
         self.subscribers.append(callback)
 
     def get_prices(self) -> dict:
+        """Current price snapshot. Each tick installs a fresh dict and never
+        mutates an old one, so callers may hold this without copying — but
+        must treat it as read-only."""
         return self._prices
 
     async def _notify(self, prices: dict):
-        self._prices = prices
+        # Replace, never mutate: the old snapshot stays valid (and identity-
+        # stable) for anything still holding it. Re-notifying with the cached
+        # snapshot (429 path) keeps the same tick_id.
+        if prices is not self._prices:
+            self._prices = prices
+            self.tick_id += 1
         for cb in self.subscribers:
             await cb(prices)
 
@@ -77,7 +89,7 @@ class MarketFeed:
                 "price": data.get("usd", 0),
                 "change_24h": data.get("usd_24h_change", 0),
                 "volume_24h": data.get("usd_24h_vol", 0),
-                "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "timestamp": iso_z_now(),
             }
         return prices
 
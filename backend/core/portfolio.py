@@ -6,6 +6,10 @@ Handles trade execution, balance tracking, and P&L calculation.
 from datetime import datetime, timezone
 from typing import Optional
 from core.db import get_db
+from core.timeutil import iso_z_now
+
+# Stable empty snapshot so to_dict(None) callers share one cache identity
+_NO_PRICES: dict = {}
 
 
 class Portfolio:
@@ -18,6 +22,11 @@ class Portfolio:
         self.agent_id = agent_id
         self._cash: float = 0.0
         self._holdings: dict[str, dict] = {}  # symbol -> {quantity, avg_cost}
+        # Bumped on every mutation; lets to_dict() reuse its last result when
+        # called repeatedly with the same price snapshot (common in handlers
+        # that broadcast both a portfolio and an agent_state frame)
+        self._version: int = 0
+        self._to_dict_cache: Optional[tuple[int, int, dict]] = None
         self._load()
 
     def _load(self):
@@ -92,6 +101,7 @@ class Portfolio:
                 (amount, self.agent_id),
             )
         self._cash += amount
+        self._version += 1
 
     def execute_trade(
         self,
@@ -127,8 +137,10 @@ class Portfolio:
         else:
             raise ValueError(f"Invalid side: {side}")
 
+        self._version += 1
+
         # Generate timestamp once — used for both DB insert and returned trade dict
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        ts = iso_z_now()
 
         # Persist to DB
         with get_db() as conn:
@@ -172,12 +184,25 @@ class Portfolio:
         }
         return trade
 
+    def touch(self):
+        """Invalidate the to_dict cache after direct mutation of internals."""
+        self._version += 1
+
     def to_dict(self, prices: dict = None) -> dict:
-        prices = prices or {}
-        return {
+        prices = prices if prices is not None else _NO_PRICES
+        # Same price snapshot + no mutations since last call → reuse the dict.
+        # The snapshot is held in the cache tuple and compared by identity:
+        # an id() alone is only unique while the object is alive, and a freed
+        # snapshot's address can be reused by a later one.
+        cached = self._to_dict_cache
+        if cached is not None and cached[0] is prices and cached[1] == self._version:
+            return cached[2]
+        result = {
             "agent_id": self.agent_id,
             "cash": self._cash,
             "holdings": self._holdings,
             "total_value": self.total_value(prices),
             "unrealized_pnl": self.unrealized_pnl(prices),
         }
+        self._to_dict_cache = (prices, self._version, result)
+        return result
@@ -0,0 +1,19 @@
+"""
+Timestamp helpers for PhantomEx.
+"""
+
+import time
+
+
+def iso_z_now() -> str:
+    """Current UTC time as an ISO 8601 string with Z suffix.
+
+    Equivalent to datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    but built with integer formatting — no tzinfo arithmetic and no
+    locale-aware strftime machinery, which matters on per-tick hot paths.
+    """
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+    )
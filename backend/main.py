@@ -4,17 +4,37 @@ Serves real-time market data, agent state, and trade events to connected clients
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import os
 import time
 import uuid
+import zlib
 from collections import Counter
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Optional
 
+try:
+    import msgpack  # optional — clients opt in via a {"type": "hello"} message
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson  # optional — much faster dumps on the broadcast path
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # optional — faster event loop; also covers runs without --loop uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 import ollama as _ollama
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
@@ -23,22 +43,34 @@ from core.db import init_db, get_db
 from core.market import MarketFeed, fetch_historical, DEFAULT_SYMBOLS
 from core.agent import AgentRegistry
 from core.portfolio import Portfolio
+from core.timeutil import iso_z_now
 
 _OLLAMA_HOST = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
 _ollama_summary_client = _ollama.AsyncClient(host=_OLLAMA_HOST)
 
 
+def _dumps(obj) -> bytes:
+    """Serialize to JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(raw):
+    """Parse JSON from str or bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 async def _generate_session_summary(
     agent_name: str, model: str, risk_profile: str, goal: str,
     allowance: float, final_value: float, pnl: float, pnl_pct: float,
     buy_count: int, sell_count: int, hold_count: int,
-    trades_data: list, duration_secs,
+    asset_counts: Counter, duration_secs,
 ) -> str:
     """Ask the agent's model to briefly analyse the trading session. Returns '' on failure."""
     try:
-        asset_counts = Counter(
-            t["symbol"] for t in trades_data if t.get("side") in ("buy", "sell")
-        )
         top_assets = ", ".join(f"{s}×{c}" for s, c in asset_counts.most_common(5)) or "none"
         if duration_secs:
             h = int(duration_secs // 3600)
@@ -96,36 +128,218 @@ def _portfolio_from_db(agent_id: str, prices: dict, conn) -> dict:
     return {"cash": cash, "holdings_value": holdings_value, "total_value": cash + holdings_value}
 
 
+def _etag_response(payload: bytes, request: Optional[Request] = None) -> Response:
+    """JSON response with a content ETag; answers 304 on an If-None-Match hit
+    so polling dashboards skip the body transfer when nothing changed."""
+    etag = f'"{hashlib.md5(payload).hexdigest()}"'
+    if request is not None and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+
+def _rows_payload(cur) -> bytes:
+    """Serialize a cursor's rows straight to JSON bytes via the column list."""
+    cols = [c[0] for c in cur.description]
+    return _dumps([dict(zip(cols, r)) for r in cur])
+
+
+def _rows_response(cur, request: Optional[Request] = None) -> Response:
+    """Cursor rows as a JSON response. Skips FastAPI's jsonable_encoder pass
+    and hands the bytes to Starlette directly."""
+    return _etag_response(_rows_payload(cur), request)
+
+
+def _unpack_session_blob(payload) -> list:
+    if not payload:
+        return []
+    return json.loads(zlib.decompress(payload))
+
+
+def _scan_trades(cur) -> tuple[bytes, Counter, Counter, Optional[str], Optional[str]]:
+    """Single pass over a trades cursor: compressed JSON-array blob plus the
+    side/asset counters and first/last timestamps the save handlers need.
+    Rows are fed straight into the compressor one at a time, so a
+    multi-thousand-trade session never materializes as a Python list."""
+    cols = [c[0] for c in cur.description]
+    side_idx = cols.index("side")
+    sym_idx = cols.index("symbol")
+    ts_idx = cols.index("timestamp")
+    sides: Counter = Counter()
+    assets: Counter = Counter()
+    first_ts = last_ts = None
+    comp = zlib.compressobj()
+    buf = bytearray(comp.compress(b"["))
+    sep = b""
+    for row in cur:
+        side = row[side_idx]
+        sides[side] += 1
+        if side in ("buy", "sell"):
+            assets[row[sym_idx]] += 1
+        if first_ts is None:
+            first_ts = row[ts_idx]
+        last_ts = row[ts_idx]
+        buf += comp.compress(sep + _dumps(dict(zip(cols, row))))
+        sep = b","
+    buf += comp.compress(b"]")
+    buf += comp.flush()
+    return bytes(buf), sides, assets, first_ts, last_ts
+
+
+def _scan_equity(cur) -> tuple[bytes, Optional[float], int]:
+    """Single pass over an equity cursor: compressed blob, last total_value, row count."""
+    cols = [c[0] for c in cur.description]
+    tv_idx = cols.index("total_value")
+    last_value = None
+    count = 0
+    comp = zlib.compressobj()
+    buf = bytearray(comp.compress(b"["))
+    sep = b""
+    for row in cur:
+        last_value = row[tv_idx]
+        count += 1
+        buf += comp.compress(sep + _dumps(dict(zip(cols, row))))
+        sep = b","
+    buf += comp.compress(b"]")
+    buf += comp.flush()
+    return bytes(buf), last_value, count
+
+
+def _store_session_blobs(conn, session_id: int, trades_blob: bytes, equity_blob: bytes):
+    """Persist a session's trades/equity as compressed blobs in their own table,
+    keeping the saved_sessions row itself small."""
+    conn.executemany(
+        """INSERT INTO session_blobs (session_id, kind, payload) VALUES (?, ?, ?)
+           ON CONFLICT(session_id, kind) DO UPDATE SET payload = excluded.payload""",
+        [
+            (session_id, "trades", trades_blob),
+            (session_id, "equity", equity_blob),
+        ],
+    )
+
+
 # ── WebSocket connection manager ──────────────────────────────────────────────
 
+# Frames a slow client may have queued before we start shedding its oldest
+OUTBOX_MAXSIZE = 256
+
+# Outbox sentinel: "send whatever price frame is in this client's slot".
+# Price ticks supersede each other, so a client that falls behind gets the
+# newest snapshot instead of replaying every stale one it missed.
+_PRICES_MARKER = object()
+
+
 class ConnectionManager:
     def __init__(self):
-        self.active: list[WebSocket] = []
+        self.active: dict[int, WebSocket] = {}
+        # id(ws) -> "json" | "msgpack"; clients default to JSON and may switch
+        # with {"type": "hello", "encoding": "msgpack"}
+        self._encodings: dict[int, str] = {}
+        # Per-client outbox + writer task: producers enqueue synchronously and
+        # never await the socket, so one slow client can't stall the others
+        self._outboxes: dict[int, asyncio.Queue] = {}
+        self._writers: dict[int, asyncio.Task] = {}
+        # id(ws) -> latest undelivered price frame (see _PRICES_MARKER)
+        self._price_slots: dict[int, bytes] = {}
 
     async def connect(self, ws: WebSocket):
         await ws.accept()
-        self.active.append(ws)
+        self.active[id(ws)] = ws
+        outbox: asyncio.Queue = asyncio.Queue(maxsize=OUTBOX_MAXSIZE)
+        self._outboxes[id(ws)] = outbox
+        self._writers[id(ws)] = asyncio.create_task(self._drain(ws, outbox))
 
     def disconnect(self, ws: WebSocket):
-        self.active.remove(ws)
-
-    async def broadcast(self, message: dict):
-        data = json.dumps(message)
-        dead = []
-        for ws in self.active:
-            try:
-                await ws.send_text(data)
-            except Exception:
-                dead.append(ws)
+        self.active.pop(id(ws), None)
+        self._encodings.pop(id(ws), None)
+        self._outboxes.pop(id(ws), None)
+        self._price_slots.pop(id(ws), None)
+        writer = self._writers.pop(id(ws), None)
+        if writer:
+            writer.cancel()
+
+    async def _drain(self, ws: WebSocket, outbox: asyncio.Queue):
+        """Per-client writer loop — the only place that awaits the socket."""
+        try:
+            while True:
+                frame = await outbox.get()
+                if frame is _PRICES_MARKER:
+                    frame = self._price_slots.pop(id(ws), None)
+                    if frame is None:
+                        continue
+                await ws.send_bytes(frame)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            self.disconnect(ws)
+
+    def _enqueue(self, ws: WebSocket, frame: bytes, coalesce: bool = False) -> bool:
+        outbox = self._outboxes.get(id(ws))
+        if outbox is None:
+            return False
+        if coalesce:
+            # Stash the frame in the client's slot; only one marker sits in
+            # the outbox at a time, so newer ticks just overwrite the slot
+            pending = id(ws) in self._price_slots
+            self._price_slots[id(ws)] = frame
+            if pending:
+                return True
+            frame = _PRICES_MARKER
+        try:
+            outbox.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            pass
+        # Shed the oldest queued frame rather than the client: a briefly
+        # stalled consumer loses stale updates but keeps its connection.
+        # Genuinely dead sockets are still reaped by their writer task.
+        try:
+            dropped = outbox.get_nowait()
+        except asyncio.QueueEmpty:
+            dropped = None
+        if dropped is _PRICES_MARKER:
+            self._price_slots.pop(id(ws), None)  # marker gone, clear its slot
+        try:
+            outbox.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            if frame is _PRICES_MARKER:
+                self._price_slots.pop(id(ws), None)
+            return False
+
+    def set_encoding(self, ws: WebSocket, encoding: str):
+        if encoding == "msgpack" and msgpack is not None:
+            self._encodings[id(ws)] = "msgpack"
+        else:
+            self._encodings.pop(id(ws), None)
+
+    def _encode(self, message: dict, encoding: str) -> bytes:
+        if encoding == "msgpack":
+            return msgpack.packb(message)
+        # Binary frames: clients parse JSON from bytes without the per-frame
+        # UTF-8 validation pass that text frames require on both peers
+        return _dumps(message)
+
+    async def broadcast(self, message: dict, json_frame: bytes = None):
+        if not self.active:
+            return
+        # Encode once per wire format in use (at most two: JSON + msgpack).
+        # Callers that broadcast the same payload repeatedly can hand in the
+        # JSON bytes they already have and skip re-serialization entirely.
+        frames = {"json": json_frame if json_frame is not None else self._encode(message, "json")}
+        if self._encodings:
+            frames["msgpack"] = self._encode(message, "msgpack")
+        coalesce = message.get("type") == "prices"
+        dead = [
+            ws for ws in list(self.active.values())
+            if not self._enqueue(ws, frames[self._encodings.get(id(ws), "json")], coalesce)
+        ]
+        # _enqueue only fails once drop-oldest itself can't make room — drop the client
         for ws in dead:
-            self.active.remove(ws)
+            self.disconnect(ws)
 
     async def send_to(self, ws: WebSocket, message: dict):
-        try:
-            await ws.send_text(json.dumps(message))
-        except Exception:
-            if ws in self.active:
-                self.active.remove(ws)
+        if not self._enqueue(ws, self._encode(message, self._encodings.get(id(ws), "json"))):
+            self.disconnect(ws)
 
 
 ws_manager = ConnectionManager()
@@ -133,31 +347,147 @@ market_feed = MarketFeed(mode="live", interval=60.0)
 agent_registry = AgentRegistry()
 
 
+# agent_id -> (portfolio version, price tick, rendered state dict). Every
+# mutating path broadcasts through _broadcast_agent_state, which refreshes
+# the entry, so the key only needs to track prices and portfolio churn.
+_rendered_agents: dict[str, tuple[int, int, dict]] = {}
+
+
+def _render_agent(agent, prices: dict) -> dict:
+    """Rendered agent state (incl. portfolio), memoized between ticks."""
+    key = (agent.portfolio._version, market_feed.tick_id)
+    cached = _rendered_agents.get(agent.agent_id)
+    if cached is not None and cached[:2] == key:
+        return cached[2]
+    data = {**agent.to_dict(), "portfolio": agent.portfolio.to_dict(prices)}
+    _rendered_agents[agent.agent_id] = (*key, data)
+    return data
+
+
+async def _broadcast_agent_state(agent, port: dict = None) -> dict:
+    """Build, cache, and broadcast an agent_state frame. Returns the state dict."""
+    if port is None:
+        port = agent.portfolio.to_dict(market_feed.get_prices())
+    data = {**agent.to_dict(), "portfolio": port}
+    _rendered_agents[agent.agent_id] = (agent.portfolio._version, market_feed.tick_id, data)
+    if not ws_manager.active:
+        return data  # nobody listening — skip the encode entirely
+    await ws_manager.broadcast({"type": "agent_state", "data": data})
+    return data
+
+
+# agent_id -> pending debounce timer. A trade's portfolio/state burst and the
+# on_thought that follows land within milliseconds of each other; debouncing
+# collapses them into a single agent_state frame per agent.
+AGENT_STATE_DEBOUNCE_SECS = 0.05
+_pending_state: dict[str, asyncio.TimerHandle] = {}
+
+
+def _schedule_agent_state(agent_id: str):
+    """Broadcast agent_state after a short debounce window (latest state wins)."""
+    handle = _pending_state.pop(agent_id, None)
+    if handle is not None:
+        handle.cancel()
+    loop = asyncio.get_running_loop()
+    _pending_state[agent_id] = loop.call_later(
+        AGENT_STATE_DEBOUNCE_SECS,
+        lambda: asyncio.ensure_future(_flush_agent_state(agent_id)),
+    )
+
+
+async def _flush_agent_state(agent_id: str):
+    _pending_state.pop(agent_id, None)
+    agent = agent_registry.get(agent_id)
+    if agent:  # removed while pending — nothing to send
+        await _broadcast_agent_state(agent)
+
+
 # ── Callbacks ─────────────────────────────────────────────────────────────────
 
+# Cap in-flight think cycles so a slow Ollama backend queues instead of
+# stacking dozens of concurrent model calls
+AGENT_CONCURRENCY = 8
+_agent_sema = asyncio.Semaphore(AGENT_CONCURRENCY)
+
+
+async def _run_one_agent(agent, prices: dict):
+    async with _agent_sema:
+        await agent.run_once(prices)
+
+
+async def _run_due_agents(agents: list, prices: dict):
+    await asyncio.gather(*(_run_one_agent(a, prices) for a in agents), return_exceptions=True)
+
+
+# Delta broadcasting: ship only the symbols that moved each tick, with a full
+# keyframe every Nth tick so any client that missed a delta reconverges
+PRICES_KEYFRAME_EVERY = 30
+_last_sent_prices: dict = {}
+_price_tick_count = 0
+
+# The price envelopes have a fixed skeleton, so the JSON frame is composed
+# around a serialized payload instead of building + encoding the wrapper dict
+# every tick (the dict is still passed to broadcast for msgpack clients)
+_PRICES_PREFIX = b'{"type":"prices","data":'
+_PRICES_DELTA_PREFIX = b'{"type":"prices_delta","data":'
+
+# Every symbol dict carries a fresh per-tick timestamp, so whole-dict
+# comparison would mark everything changed every tick; a symbol only belongs
+# in a delta when a field a client renders actually moved
+_PRICE_DELTA_FIELDS = ("price", "change_24h", "volume_24h")
+
+
+def _price_moved(old: Optional[dict], new: dict) -> bool:
+    if old is None:
+        return True
+    return any(old.get(f) != new.get(f) for f in _PRICE_DELTA_FIELDS)
+
+
 async def on_price_update(prices: dict):
-    await ws_manager.broadcast({"type": "prices", "data": prices})
-    # Trigger agent decision cycles
-    for agent in agent_registry.all():
-        asyncio.create_task(agent.run_once(prices))
+    global _last_sent_prices, _price_tick_count
+    _price_tick_count += 1
+    if ws_manager.active:
+        if _last_sent_prices and _price_tick_count % PRICES_KEYFRAME_EVERY != 0:
+            delta = {s: p for s, p in prices.items()
+                     if _price_moved(_last_sent_prices.get(s), p)}
+            if delta:
+                await ws_manager.broadcast(
+                    {"type": "prices_delta", "data": delta},
+                    json_frame=_PRICES_DELTA_PREFIX + _dumps(delta) + b"}",
+                )
+        else:
+            await ws_manager.broadcast(
+                {"type": "prices", "data": prices},
+                json_frame=_PRICES_PREFIX + _dumps(prices) + b"}",
+            )
+    _last_sent_prices = prices
+    # Trigger agent decision cycles — one task gathers all due agents, instead
+    # of allocating a Task per agent per tick
+    now = time.time()
+    due = [agent for agent in agent_registry.all() if agent.due(now)]
+    if due:
+        asyncio.create_task(_run_due_agents(due, prices))
 
 
 async def on_trade(agent_id: str, trade: dict):
+    global _trades_version
+    _trades_version += 1  # invalidate /api/trades caching
+    if not ws_manager.active:
+        return  # the rest is pure fan-out; nothing to do with zero clients
     await ws_manager.broadcast({"type": "trade", "agent_id": agent_id, "data": trade})
     agent = agent_registry.get(agent_id)
     if agent:
         prices = market_feed.get_prices()
+        port = agent.portfolio.to_dict(prices)
         # Broadcast updated portfolio
         await ws_manager.broadcast({
             "type": "portfolio",
             "agent_id": agent_id,
-            "data": agent.portfolio.to_dict(prices),
-        })
-        # Broadcast updated agent state (includes last_thought)
-        await ws_manager.broadcast({
-            "type": "agent_state",
-            "data": {**agent.to_dict(), "portfolio": agent.portfolio.to_dict(prices)},
+            "data": port,
         })
+        # Agent state (includes last_thought) goes out debounced — the
+        # on_thought for this same cycle would duplicate it otherwise
+        _schedule_agent_state(agent_id)
 
 
 async def on_decision(agent_id: str, decision: dict):
@@ -175,25 +505,59 @@ async def on_thought(agent_id: str):
     if agent:
         prices = market_feed.get_prices()
         port = agent.portfolio.to_dict(prices)
-        await ws_manager.broadcast({
-            "type": "agent_state",
-            "data": {**agent.to_dict(), "portfolio": port},
-        })
-        # Persist equity snapshot so chart survives page refresh
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        with get_db() as conn:
-            conn.execute(
-                "INSERT INTO equity_snapshots (agent_id, total_value, cash, timestamp) VALUES (?, ?, ?, ?)",
-                (agent_id, port.get("total_value", 0), port.get("cash", 0), ts),
-            )
-            # Keep only last 500 snapshots per agent to avoid unbounded growth
-            conn.execute(
-                """DELETE FROM equity_snapshots WHERE agent_id = ? AND id NOT IN (
-                    SELECT id FROM equity_snapshots WHERE agent_id = ?
-                    ORDER BY timestamp DESC LIMIT 500
-                )""",
-                (agent_id, agent_id),
-            )
+        _schedule_agent_state(agent_id)
+        # Buffer the equity snapshot; the flush loop persists batches so each
+        # think cycle doesn't pay its own transaction + fsync
+        _equity_buffer.append(
+            (agent_id, port.get("total_value", 0), port.get("cash", 0), iso_z_now())
+        )
+
+
+# ── Equity snapshot batching ──────────────────────────────────────────────────
+
+EQUITY_FLUSH_SECS = 5.0
+
+# Pending (agent_id, total_value, cash, timestamp) rows awaiting a flush.
+# Only touched from the event loop, so no locking is needed.
+_equity_buffer: list[tuple] = []
+
+# Prune retention only every Nth flush — the cap is a soft limit, and running
+# the per-agent prune on every flush window buys nothing but write churn
+EQUITY_PRUNE_EVERY = 20
+_equity_flush_count = 0
+
+
+def _flush_equity_buffer():
+    global _equity_flush_count
+    if not _equity_buffer:
+        return
+    batch = _equity_buffer[:]
+    del _equity_buffer[:]
+    _equity_flush_count += 1
+    with get_db() as conn:
+        conn.executemany(
+            "INSERT INTO equity_snapshots (agent_id, total_value, cash, timestamp) VALUES (?, ?, ?, ?)",
+            batch,
+        )
+        # Keep only last 500 snapshots per agent to avoid unbounded growth
+        if _equity_flush_count % EQUITY_PRUNE_EVERY == 0:
+            for aid in {row[0] for row in batch}:
+                conn.execute(
+                    """DELETE FROM equity_snapshots WHERE agent_id = ? AND id NOT IN (
+                        SELECT id FROM equity_snapshots WHERE agent_id = ?
+                        ORDER BY timestamp DESC LIMIT 500
+                    )""",
+                    (aid, aid),
+                )
+
+
+async def _equity_flush_loop():
+    while True:
+        await asyncio.sleep(EQUITY_FLUSH_SECS)
+        try:
+            _flush_equity_buffer()
+        except Exception as e:
+            print(f"[equity] Flush failed: {e}")
 
 
 # ── App lifecycle ─────────────────────────────────────────────────────────────
@@ -209,14 +573,23 @@ async def lifespan(app: FastAPI):
     )
     market_feed.subscribe(on_price_update)
     asyncio.create_task(market_feed.start())
+    flush_task = asyncio.create_task(_equity_flush_loop())
     print("[phantomex] Server started.")
     yield
     await agent_registry.stop_all()
     await market_feed.stop()
+    flush_task.cancel()
+    _flush_equity_buffer()  # don't lose buffered snapshots on shutdown
     print("[phantomex] Server stopped.")
 
 
-app = FastAPI(title="PhantomEx", version="0.1.0", lifespan=lifespan)
+app = FastAPI(
+    title="PhantomEx",
+    version="0.1.0",
+    lifespan=lifespan,
+    # Same encoder as the WebSocket hub: orjson when installed, stdlib otherwise
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -229,35 +602,68 @@ app.add_middleware(
 
 # ── WebSocket endpoint ────────────────────────────────────────────────────────
 
+def _recent_trades(limit: int = 100) -> list[dict]:
+    """Newest-first trade rows for the connect snapshot."""
+    with get_db() as conn:
+        cur = conn.execute(
+            "SELECT * FROM trades ORDER BY timestamp DESC LIMIT ?", (limit,))
+        cols = [c[0] for c in cur.description]
+        return [dict(zip(cols, r)) for r in cur]
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
     await ws_manager.connect(ws)
-    # Send current state on connect
+    # Send current state on connect as one batched frame instead of a prices
+    # frame plus one agent_state per agent (_render_agent is memoized, so the
+    # per-connect cost is a single serialization). Seed trades ride along so
+    # clients don't need a separate REST round trip to fill their log.
     prices = market_feed.get_prices()
-    if prices:
-        await ws_manager.send_to(ws, {"type": "prices", "data": prices})
-    for agent in agent_registry.all():
-        await ws_manager.send_to(ws, {
-            "type": "agent_state",
-            "data": {
-                **agent.to_dict(),
-                "portfolio": agent.portfolio.to_dict(prices),
-            },
-        })
+    await ws_manager.send_to(ws, {
+        "type": "snapshot",
+        "prices": prices,
+        "agents": [_render_agent(a, prices) for a in agent_registry.all()],
+        "trades": await asyncio.to_thread(_recent_trades),
+    })
     try:
         while True:
-            raw = await ws.receive_text()
-            msg = json.loads(raw)
-            await handle_ws_message(ws, msg)
+            packet = await ws.receive()
+            if packet["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(packet.get("code", 1000))
+            data = packet.get("bytes")
+            if data is not None:
+                await handle_ws_opcode(ws, data)
+            else:
+                await handle_ws_message(ws, _loads(packet["text"]))
     except WebSocketDisconnect:
         ws_manager.disconnect(ws)
 
 
+async def handle_ws_opcode(ws: WebSocket, data: bytes):
+    """Compact binary control frames: one opcode byte, then an optional
+    agent id. Spares high-rate clients (pings, approvals) JSON on both ends."""
+    op = data[:1]
+    if op == b"P":
+        await ws_manager.send_to(ws, {"type": "pong"})
+    elif op == b"A":
+        agent = agent_registry.get(data[1:].decode())
+        if agent:
+            await agent.approve_pending(market_feed.get_prices())
+    elif op == b"R":
+        agent = agent_registry.get(data[1:].decode())
+        if agent:
+            agent.reject_pending()
+
+
 async def handle_ws_message(ws: WebSocket, msg: dict):
     """Handle incoming messages from the browser over WebSocket."""
     event = msg.get("type")
 
-    if event == "approve_trade":
+    if event == "hello":
+        # Client announces its preferred wire encoding ("json" | "msgpack")
+        ws_manager.set_encoding(ws, msg.get("encoding", "json"))
+
+    elif event == "approve_trade":
         agent_id = msg.get("agent_id")
         agent = agent_registry.get(agent_id)
         if agent:
@@ -303,39 +709,45 @@ async def create_agent(req: CreateAgentRequest):
         on_thought=on_thought,
     )
 
+    prices = market_feed.get_prices()
+
     # Seed initial holdings if provided — inserted directly (no cash deducted)
     if req.initial_holdings:
-        prices = market_feed.get_prices()
-        for symbol, quantity in req.initial_holdings.items():
-            symbol = symbol.upper()
-            if symbol not in prices or quantity <= 0:
-                continue
-            price = prices[symbol]["price"]
+        rows = [
+            (agent.agent_id, symbol, quantity, prices[symbol]["price"])
+            for symbol, quantity in (
+                (s.upper(), q) for s, q in req.initial_holdings.items()
+            )
+            if symbol in prices and quantity > 0
+        ]
+        def _seed_holdings():
             with get_db() as conn:
-                conn.execute(
+                conn.executemany(
                     """INSERT INTO portfolios (agent_id, symbol, quantity, avg_cost, updated_at)
                        VALUES (?, ?, ?, ?, datetime('now'))
                        ON CONFLICT(agent_id, symbol) DO UPDATE SET
                            quantity = excluded.quantity,
                            avg_cost = excluded.avg_cost,
                            updated_at = excluded.updated_at""",
-                    (agent.agent_id, symbol, quantity, price),
+                    rows,
                 )
+
+        # SQLite write off the event loop — a slow fsync here must not stall
+        # the broadcast path (db.py caches one connection per executor thread)
+        await asyncio.to_thread(_seed_holdings)
+        for _, symbol, quantity, price in rows:
             agent.portfolio._holdings[symbol] = {"quantity": quantity, "avg_cost": price}
+        agent.portfolio.touch()
 
-    prices = market_feed.get_prices()
-    data = {**agent.to_dict(), "portfolio": agent.portfolio.to_dict(prices)}
-    await ws_manager.broadcast({"type": "agent_state", "data": data})
-    return data
+    return await _broadcast_agent_state(agent, agent.portfolio.to_dict(prices))
 
 
 @app.get("/api/agents")
-async def list_agents():
+async def list_agents(request: Request):
     prices = market_feed.get_prices()
-    return [
-        {**a.to_dict(), "portfolio": a.portfolio.to_dict(prices)}
-        for a in agent_registry.all()
-    ]
+    return _etag_response(_dumps([
+        _render_agent(a, prices) for a in agent_registry.all()
+    ]), request)
 
 
 @app.delete("/api/agents/{agent_id}")
@@ -344,6 +756,10 @@ async def delete_agent(agent_id: str):
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
     await agent_registry.remove(agent_id)
+    _rendered_agents.pop(agent_id, None)
+    handle = _pending_state.pop(agent_id, None)
+    if handle is not None:
+        handle.cancel()
     await ws_manager.broadcast({"type": "agent_removed", "agent_id": agent_id})
     return {"ok": True}
 
@@ -372,7 +788,7 @@ async def set_agent_mode(agent_id: str, body: dict):
     if mode not in ("autonomous", "advisory"):
         raise HTTPException(status_code=400, detail="Invalid mode")
     agent.mode = mode
-    await ws_manager.broadcast({"type": "agent_state", "data": agent.to_dict()})
+    _schedule_agent_state(agent_id)
     return {"ok": True}
 
 
@@ -386,13 +802,13 @@ async def set_risk_profile(agent_id: str, body: dict):
     if profile not in ("aggressive", "neutral", "safe"):
         raise HTTPException(status_code=400, detail="Invalid risk profile")
     agent.risk_profile = profile
-    with get_db() as conn:
-        conn.execute("UPDATE agents SET risk_profile = ? WHERE id = ?", (profile, agent_id))
-    prices = market_feed.get_prices()
-    await ws_manager.broadcast({
-        "type": "agent_state",
-        "data": {**agent.to_dict(), "portfolio": agent.portfolio.to_dict(prices)},
-    })
+
+    def _persist():
+        with get_db() as conn:
+            conn.execute("UPDATE agents SET risk_profile = ? WHERE id = ?", (profile, agent_id))
+
+    await asyncio.to_thread(_persist)
+    _schedule_agent_state(agent_id)
     return {"ok": True}
 
 
@@ -404,14 +820,13 @@ async def set_agent_duration(agent_id: str, body: dict):
         raise HTTPException(status_code=404, detail="Agent not found")
     max_duration = body.get("max_duration")  # None clears the limit
     agent.max_duration = max_duration
-    from core.db import get_db
-    with get_db() as conn:
-        conn.execute("UPDATE agents SET max_duration = ? WHERE id = ?", (max_duration, agent_id))
-    prices = market_feed.get_prices()
-    await ws_manager.broadcast({
-        "type": "agent_state",
-        "data": {**agent.to_dict(), "portfolio": agent.portfolio.to_dict(prices)},
-    })
+
+    def _persist():
+        with get_db() as conn:
+            conn.execute("UPDATE agents SET max_duration = ? WHERE id = ?", (max_duration, agent_id))
+
+    await asyncio.to_thread(_persist)
+    _schedule_agent_state(agent_id)
     return {"ok": True}
 
 
@@ -429,17 +844,21 @@ async def deposit_to_agent(agent_id: str, req: DepositRequest):
         raise HTTPException(status_code=400, detail="Amount must be positive")
     agent.portfolio.deposit(req.amount)
     agent.allowance += req.amount  # keep in-memory allowance in sync for to_dict() P&L
-    prices = market_feed.get_prices()
-    await ws_manager.broadcast({
-        "type": "agent_state",
-        "data": {**agent.to_dict(), "portfolio": agent.portfolio.to_dict(prices)},
-    })
+    _schedule_agent_state(agent_id)
     return {"ok": True, "new_cash": agent.portfolio.cash}
 
 
+# (tick_id, serialized snapshot) — reused until the feed installs a new tick
+_prices_cache: tuple[int, bytes] = (-1, b"")
+
+
 @app.get("/api/market/prices")
-async def get_prices():
-    return market_feed.get_prices()
+async def get_prices(request: Request):
+    global _prices_cache
+    tick = market_feed.tick_id
+    if tick != _prices_cache[0]:
+        _prices_cache = (tick, _dumps(market_feed.get_prices()))
+    return _etag_response(_prices_cache[1], request)
 
 
 @app.get("/api/market/history/{symbol}")
@@ -451,15 +870,17 @@ async def get_history(symbol: str, days: int = 30):
         raise HTTPException(status_code=502, detail=str(e))
 
 
+_symbols_payload = _dumps(DEFAULT_SYMBOLS)  # static for the process lifetime
+
+
 @app.get("/api/market/symbols")
-async def get_symbols():
-    return DEFAULT_SYMBOLS
+async def get_symbols(request: Request):
+    return _etag_response(_symbols_payload, request)
 
 
 @app.post("/api/agents/{agent_id}/save_session")
 async def save_session(agent_id: str, body: dict = {}):
     """Snapshot the current agent session into saved_sessions for training data / review."""
-    import json as _json
     agent = agent_registry.get(agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
@@ -474,27 +895,27 @@ async def save_session(agent_id: str, body: dict = {}):
     allowance = agent.allowance
     pnl = final_value - allowance
     pnl_pct = (pnl / allowance * 100) if allowance else 0
-    saved_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    saved_at = iso_z_now()
     notes = body.get("notes", "")
     goal = agent.goal or ""
 
     with get_db() as conn:
-        trade_rows = conn.execute(
+        trades_blob, _, asset_counts, _, _ = _scan_trades(conn.execute(
             "SELECT * FROM trades WHERE agent_id = ? ORDER BY timestamp ASC",
             (agent_id,),
-        ).fetchall()
-        trades_data = [dict(r) for r in trade_rows]
+        ))
 
-        buy_count  = sum(1 for t in trades_data if t["side"] == "buy")
-        sell_count = sum(1 for t in trades_data if t["side"] == "sell")
-        hold_count = sum(1 for t in trades_data if t["side"] == "hold")
+        # Counts come from the agent's running counters (seeded from DB, kept
+        # current by execute_decision) — no per-save rescan of the trade list
+        buy_count  = agent.side_counts["buy"]
+        sell_count = agent.side_counts["sell"]
+        hold_count = agent.side_counts["hold"]
         trade_count = buy_count + sell_count
 
-        eq_rows = conn.execute(
+        equity_blob, _, _ = _scan_equity(conn.execute(
             "SELECT total_value, cash, timestamp FROM equity_snapshots WHERE agent_id = ? ORDER BY timestamp ASC",
             (agent_id,),
-        ).fetchall()
-        equity_data = [dict(r) for r in eq_rows]
+        ))
 
         conn.execute(
             """INSERT INTO saved_sessions
@@ -509,19 +930,19 @@ async def save_session(agent_id: str, body: dict = {}):
                 trade_count, buy_count, sell_count, hold_count,
                 started_at, ended_at, duration,
                 goal, notes, "",
-                _json.dumps(trades_data),
-                _json.dumps(equity_data),
+                "[]", "[]",  # trades/equity live in session_blobs
                 saved_at,
             ),
         )
         session_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        _store_session_blobs(conn, session_id, trades_blob, equity_blob)
 
     # Generate AI summary after inserting so we don't block the insert
     summary = await _generate_session_summary(
         agent.name, agent.model, agent.risk_profile, goal,
         allowance, final_value, pnl, pnl_pct,
         buy_count, sell_count, hold_count,
-        trades_data, duration,
+        asset_counts, duration,
     )
     if summary:
         with get_db() as conn:
@@ -540,16 +961,18 @@ async def save_session(agent_id: str, body: dict = {}):
 
 
 @app.get("/api/sessions")
-async def list_sessions():
+async def list_sessions(request: Request):
     """List all saved sessions (summary only, no trade JSON)."""
-    with get_db() as conn:
-        rows = conn.execute(
-            """SELECT id, agent_id, agent_name, model, risk_profile, allowance,
-                      final_value, pnl, pnl_pct, trade_count, buy_count, sell_count,
-                      hold_count, started_at, ended_at, duration_secs, notes, saved_at
-               FROM saved_sessions ORDER BY saved_at DESC"""
-        ).fetchall()
-    return [dict(r) for r in rows]
+    def _fetch() -> bytes:
+        with get_db() as conn:
+            return _rows_payload(conn.execute(
+                """SELECT id, agent_id, agent_name, model, risk_profile, allowance,
+                          final_value, pnl, pnl_pct, trade_count, buy_count, sell_count,
+                          hold_count, started_at, ended_at, duration_secs, notes, saved_at
+                   FROM saved_sessions ORDER BY saved_at DESC"""
+            ))
+
+    return _etag_response(await asyncio.to_thread(_fetch), request)
 
 
 @app.get("/api/sessions/{session_id}")
@@ -559,12 +982,25 @@ async def get_session(session_id: int):
         row = conn.execute(
             "SELECT * FROM saved_sessions WHERE id = ?", (session_id,)
         ).fetchone()
-    if not row:
-        raise HTTPException(status_code=404, detail="Session not found")
-    import json as _json
+        if not row:
+            raise HTTPException(status_code=404, detail="Session not found")
+        blobs = {
+            r["kind"]: r["payload"]
+            for r in conn.execute(
+                "SELECT kind, payload FROM session_blobs WHERE session_id = ?",
+                (session_id,),
+            )
+        }
     data = dict(row)
-    data["trades"] = _json.loads(data.pop("trades_json", "[]"))
-    data["equity"] = _json.loads(data.pop("equity_json", "[]"))
+    legacy_trades = data.pop("trades_json", "[]")
+    legacy_equity = data.pop("equity_json", "[]")
+    if blobs:
+        data["trades"] = _unpack_session_blob(blobs.get("trades"))
+        data["equity"] = _unpack_session_blob(blobs.get("equity"))
+    else:
+        # Sessions saved before the blob table existed
+        data["trades"] = json.loads(legacy_trades or "[]")
+        data["equity"] = json.loads(legacy_equity or "[]")
     return data
 
 
@@ -572,6 +1008,7 @@ async def get_session(session_id: int):
 async def delete_session(session_id: int):
     """Delete a saved session."""
     with get_db() as conn:
+        conn.execute("DELETE FROM session_blobs WHERE session_id = ?", (session_id,))
         conn.execute("DELETE FROM saved_sessions WHERE id = ?", (session_id,))
     return {"ok": True}
 
@@ -580,32 +1017,26 @@ async def delete_session(session_id: int):
 async def recover_session(agent_id: str, body: dict = {}):
     """Save a complete session snapshot from any agent (active or inactive) using full DB history.
     Useful for recovering sessions from agents that were deleted before saving."""
-    import json as _json
-
     prices = market_feed.get_prices()
     with get_db() as conn:
         agent_row = conn.execute("SELECT * FROM agents WHERE id = ?", (agent_id,)).fetchone()
         if not agent_row:
             raise HTTPException(status_code=404, detail="Agent not found")
 
-        trade_rows = conn.execute(
+        trades_blob, sides, asset_counts, first_ts, last_ts = _scan_trades(conn.execute(
             "SELECT * FROM trades WHERE agent_id = ? ORDER BY timestamp ASC", (agent_id,)
-        ).fetchall()
-        trades_data = [dict(r) for r in trade_rows]
-        buy_count  = sum(1 for t in trades_data if t["side"] == "buy")
-        sell_count = sum(1 for t in trades_data if t["side"] == "sell")
-        hold_count = sum(1 for t in trades_data if t["side"] == "hold")
+        ))
+        buy_count, sell_count, hold_count = sides["buy"], sides["sell"], sides["hold"]
         trade_count = buy_count + sell_count
 
-        eq_rows = conn.execute(
+        equity_blob, last_equity, eq_count = _scan_equity(conn.execute(
             "SELECT total_value, cash, timestamp FROM equity_snapshots WHERE agent_id = ? ORDER BY timestamp ASC",
             (agent_id,),
-        ).fetchall()
-        equity_data = [dict(r) for r in eq_rows]
+        ))
 
         # Portfolio: prefer last equity snapshot (reflects actual state), fall back to trade replay
-        if equity_data:
-            final_value = equity_data[-1]["total_value"]
+        if eq_count:
+            final_value = last_equity
         else:
             port = _portfolio_from_db(agent_id, prices, conn)
             final_value = port["total_value"]
@@ -616,14 +1047,14 @@ async def recover_session(agent_id: str, body: dict = {}):
 
         # Timing: started_at from DB or infer from first trade
         started_at = agent_row["started_at"]
-        if not started_at and trades_data:
+        if not started_at and first_ts:
             started_at = datetime.fromisoformat(
-                trades_data[0]["timestamp"].replace("Z", "+00:00")
+                first_ts.replace("Z", "+00:00")
             ).timestamp()
         # ended_at: last trade for inactive agents, now for active
-        if not agent_row["active"] and trades_data:
+        if not agent_row["active"] and last_ts:
             ended_at = datetime.fromisoformat(
-                trades_data[-1]["timestamp"].replace("Z", "+00:00")
+                last_ts.replace("Z", "+00:00")
             ).timestamp()
         else:
             ended_at = time.time()
@@ -631,7 +1062,7 @@ async def recover_session(agent_id: str, body: dict = {}):
         duration = (ended_at - started_at) if started_at else None
         goal = agent_row["goal"] or ""
         notes = body.get("notes", "")
-        saved_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        saved_at = iso_z_now()
 
         conn.execute(
             """INSERT INTO saved_sessions
@@ -647,18 +1078,18 @@ async def recover_session(agent_id: str, body: dict = {}):
                 trade_count, buy_count, sell_count, hold_count,
                 started_at, ended_at, duration,
                 goal, notes, "",
-                _json.dumps(trades_data),
-                _json.dumps(equity_data),
+                "[]", "[]",  # trades/equity live in session_blobs
                 saved_at,
             ),
         )
         session_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        _store_session_blobs(conn, session_id, trades_blob, equity_blob)
 
     summary = await _generate_session_summary(
         agent_row["name"], agent_row["model"], agent_row["risk_profile"] or "neutral", goal,
         allowance, final_value, pnl, pnl_pct,
         buy_count, sell_count, hold_count,
-        trades_data, duration,
+        asset_counts, duration,
     )
     if summary:
         with get_db() as conn:
@@ -680,8 +1111,6 @@ async def recover_session(agent_id: str, body: dict = {}):
 async def recapture_session(session_id: int):
     """Rebuild an existing saved session with the agent's complete DB history.
     Fixes sessions that were saved too early (incomplete trade counts / wrong duration)."""
-    import json as _json
-
     prices = market_feed.get_prices()
     with get_db() as conn:
         sess_row = conn.execute(
@@ -695,24 +1124,20 @@ async def recapture_session(session_id: int):
         if not agent_row:
             raise HTTPException(status_code=404, detail="Agent data not found")
 
-        trade_rows = conn.execute(
+        trades_blob, sides, asset_counts, first_ts, last_ts = _scan_trades(conn.execute(
             "SELECT * FROM trades WHERE agent_id = ? ORDER BY timestamp ASC", (agent_id,)
-        ).fetchall()
-        trades_data = [dict(r) for r in trade_rows]
-        buy_count  = sum(1 for t in trades_data if t["side"] == "buy")
-        sell_count = sum(1 for t in trades_data if t["side"] == "sell")
-        hold_count = sum(1 for t in trades_data if t["side"] == "hold")
+        ))
+        buy_count, sell_count, hold_count = sides["buy"], sides["sell"], sides["hold"]
         trade_count = buy_count + sell_count
 
-        eq_rows = conn.execute(
+        equity_blob, last_equity, eq_count = _scan_equity(conn.execute(
             "SELECT total_value, cash, timestamp FROM equity_snapshots WHERE agent_id = ? ORDER BY timestamp ASC",
             (agent_id,),
-        ).fetchall()
-        equity_data = [dict(r) for r in eq_rows]
+        ))
 
         # Use last equity snapshot for final_value (most accurate historical record)
-        if equity_data:
-            final_value = equity_data[-1]["total_value"]
+        if eq_count:
+            final_value = last_equity
         else:
             port = _portfolio_from_db(agent_id, prices, conn)
             final_value = port["total_value"]
@@ -722,13 +1147,13 @@ async def recapture_session(session_id: int):
         pnl_pct = (pnl / allowance * 100) if allowance else 0
 
         started_at = agent_row["started_at"]
-        if not started_at and trades_data:
+        if not started_at and first_ts:
             started_at = datetime.fromisoformat(
-                trades_data[0]["timestamp"].replace("Z", "+00:00")
+                first_ts.replace("Z", "+00:00")
             ).timestamp()
-        if not agent_row["active"] and trades_data:
+        if not agent_row["active"] and last_ts:
             ended_at = datetime.fromisoformat(
-                trades_data[-1]["timestamp"].replace("Z", "+00:00")
+                last_ts.replace("Z", "+00:00")
             ).timestamp()
         else:
             ended_at = sess_row["ended_at"]
@@ -740,24 +1165,23 @@ async def recapture_session(session_id: int):
                final_value=?, pnl=?, pnl_pct=?,
                trade_count=?, buy_count=?, sell_count=?, hold_count=?,
                started_at=?, ended_at=?, duration_secs=?,
-               goal=?, trades_json=?, equity_json=?
+               goal=?, trades_json='[]', equity_json='[]'
                WHERE id=?""",
             (
                 final_value, pnl, pnl_pct,
                 trade_count, buy_count, sell_count, hold_count,
                 started_at, ended_at, duration,
                 goal,
-                _json.dumps(trades_data),
-                _json.dumps(equity_data),
                 session_id,
             ),
         )
+        _store_session_blobs(conn, session_id, trades_blob, equity_blob)
 
     summary = await _generate_session_summary(
         agent_row["name"], agent_row["model"], agent_row["risk_profile"] or "neutral", goal,
         allowance, final_value, pnl, pnl_pct,
         buy_count, sell_count, hold_count,
-        trades_data, duration,
+        asset_counts, duration,
     )
     if summary:
         with get_db() as conn:
@@ -774,42 +1198,86 @@ async def recapture_session(session_id: int):
 
 
 @app.get("/api/agents/{agent_id}/equity")
-async def get_equity(agent_id: str, limit: int = 500):
+async def get_equity(agent_id: str, request: Request, limit: int = 500):
     """Return persisted equity snapshots for chart seeding on page load."""
-    with get_db() as conn:
-        rows = conn.execute(
-            "SELECT total_value, cash, timestamp FROM equity_snapshots WHERE agent_id = ? ORDER BY timestamp ASC LIMIT ?",
-            (agent_id, limit),
-        ).fetchall()
-    return [dict(r) for r in rows]
+    def _fetch() -> bytes:
+        with get_db() as conn:
+            return _rows_payload(conn.execute(
+                "SELECT total_value, cash, timestamp FROM equity_snapshots WHERE agent_id = ? ORDER BY timestamp ASC LIMIT ?",
+                (agent_id, limit),
+            ))
+
+    return _etag_response(await asyncio.to_thread(_fetch), request)
+
+
+# (agent_id, limit) -> (expires_at, trades_version, payload). Every dashboard
+# and TUI seeds its trade log from this endpoint, so identical queries land in
+# bursts; _trades_version (bumped in on_trade) drops stale entries early.
+TRADES_CACHE_TTL = 5.0
+_trades_version = 0
+_trades_cache: dict[tuple, tuple[float, int, bytes]] = {}
+
+# Cache keys come straight from client query params, so an insert must never
+# grow the dict unbounded: expired entries go first, then the oldest live
+# ones once the cap is reached (dicts iterate in insertion order).
+CACHE_MAX_ENTRIES = 64
+
+
+def _cache_put(cache: dict, key, value) -> None:
+    now = time.time()
+    for k in [k for k, v in cache.items() if v[0] <= now]:
+        del cache[k]
+    while len(cache) >= CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = value
 
 
 @app.get("/api/trades")
-async def get_trades(agent_id: Optional[str] = None, limit: int = 1000):
-    with get_db() as conn:
-        if agent_id:
-            rows = conn.execute(
-                "SELECT * FROM trades WHERE agent_id = ? ORDER BY timestamp DESC LIMIT ?",
-                (agent_id, limit),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT * FROM trades ORDER BY timestamp DESC LIMIT ?", (limit,)
-            ).fetchall()
-    return [dict(r) for r in rows]
+async def get_trades(request: Request, agent_id: Optional[str] = None, limit: int = 1000):
+    key = (agent_id, limit)
+    cached = _trades_cache.get(key)
+    if cached and cached[0] > time.time() and cached[1] == _trades_version:
+        return _etag_response(cached[2], request)
+    def _fetch() -> bytes:
+        with get_db() as conn:
+            if agent_id:
+                cur = conn.execute(
+                    "SELECT * FROM trades WHERE agent_id = ? ORDER BY timestamp DESC LIMIT ?",
+                    (agent_id, limit),
+                )
+            else:
+                cur = conn.execute(
+                    "SELECT * FROM trades ORDER BY timestamp DESC LIMIT ?", (limit,)
+                )
+            return _rows_payload(cur)
+
+    payload = await asyncio.to_thread(_fetch)
+    _cache_put(_trades_cache, key, (time.time() + TRADES_CACHE_TTL, _trades_version, payload))
+    return _etag_response(payload, request)
+
+
+# host -> (expires_at, model names); dashboards poll this for the dropdown
+OLLAMA_MODELS_TTL = 30.0
+_ollama_models_cache: dict[str, tuple[float, list]] = {}
 
 
 @app.get("/api/ollama/models")
 async def list_ollama_models(host: Optional[str] = None):
     """List available models from the Ollama instance at the given host."""
+    effective_host = host or _OLLAMA_HOST
+    cached = _ollama_models_cache.get(effective_host)
+    if cached and cached[0] > time.time():
+        return cached[1]
     try:
-        import ollama, os
-        effective_host = host or os.environ.get("OLLAMA_HOST", "http://localhost:11434")
-        client = ollama.Client(host=effective_host)
-        models = client.list()
-        return [m["model"] for m in models.get("models", [])]
+        # ollama.Client.list() is a blocking HTTP call — keep it off the loop
+        client = _ollama.Client(host=effective_host)
+        models = await asyncio.to_thread(client.list)
+        names = [m["model"] for m in models.get("models", [])]
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Ollama error: {e}")
+    # host is a client-supplied query param — bounded insert, like _trades_cache
+    _cache_put(_ollama_models_cache, effective_host, (time.time() + OLLAMA_MODELS_TTL, names))
+    return names
 
 
 @app.get("/health")
@@ -819,14 +1287,23 @@ async def health():
 
 # ── Serve frontend static files (must be last) ───────────────────────────────
 
-import os
-from fastapi.responses import FileResponse
-
 _frontend_dist = os.path.join(os.path.dirname(__file__), "..", "frontend", "dist")
 if os.path.isdir(_frontend_dist):
     app.mount("/assets", StaticFiles(directory=os.path.join(_frontend_dist, "assets")), name="assets")
 
+    # index.html never changes at runtime — read it once, compress it once,
+    # and serve either variant from memory
+    with open(os.path.join(_frontend_dist, "index.html"), "rb") as _f:
+        _index_bytes = _f.read()
+    _index_gz = gzip.compress(_index_bytes, compresslevel=9)
+    _index_etag = f'"{hashlib.md5(_index_bytes).hexdigest()}"'
+
     @app.get("/{full_path:path}", include_in_schema=False)
-    async def serve_spa(full_path: str):
-        index = os.path.join(_frontend_dist, "index.html")
-        return FileResponse(index)
+    async def serve_spa(full_path: str, request: Request):
+        if request.headers.get("if-none-match") == _index_etag:
+            return Response(status_code=304)
+        headers = {"ETag": _index_etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return Response(_index_gz, media_type="text/html", headers=headers)
+        return Response(_index_bytes, media_type="text/html", headers=headers)
@@ -10,17 +10,44 @@ Controls: Q or ESC to exit.
 
 import asyncio
 import curses
+import functools
 import json
-import subprocess
+import os
+import random
+import shutil
+import signal
 import sys
 import time
-import threading
-from datetime import datetime, timezone
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-import httpx
 import websockets
 
+try:
+    import orjson  # same optional speedup the backend uses on its send path
+except ImportError:
+    orjson = None
+
+try:
+    import pynvml  # optional — in-process NVML beats forking nvidia-smi
+except ImportError:
+    pynvml = None
+
+try:
+    import uvloop  # optional — faster event loop for the WS-ingest side
+except ImportError:
+    uvloop = None
+
+
+def _loads(raw):
+    """Parse an incoming frame (str or bytes) with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, (bytes, bytearray)):
+        raw = raw.decode("utf-8")
+    return json.loads(raw)
+
 
 WS_URL  = "ws://localhost:8000/ws"
 HTTP_URL = "http://localhost:8000"
@@ -31,7 +58,13 @@ HTTP_URL = "http://localhost:8000"
 #   1 = green    2 = red     3 = cyan    4 = yellow
 #   5 = dim/grey 6 = white   7 = magenta 8 = header blue
 
+# Attribute ints resolved once by init_colors() — color_pair() is a C call
+# and the draw loops reference these constants a dozen times per row
+GREEN = RED = CYAN = YELLOW = DIM = WHITE = MAG = BLUE = 0
+
+
 def init_colors():
+    global GREEN, RED, CYAN, YELLOW, DIM, WHITE, MAG, BLUE
     curses.start_color()
     curses.use_default_colors()
     curses.init_pair(1, curses.COLOR_GREEN,   -1)
@@ -42,22 +75,53 @@ def init_colors():
     curses.init_pair(6, curses.COLOR_WHITE,   -1)
     curses.init_pair(7, curses.COLOR_MAGENTA, -1)
     curses.init_pair(8, 12,                   -1)  # bright blue for headers
-
-GREEN  = lambda: curses.color_pair(1)
-RED    = lambda: curses.color_pair(2)
-CYAN   = lambda: curses.color_pair(3)
-YELLOW = lambda: curses.color_pair(4)
-DIM    = lambda: curses.color_pair(5)
-WHITE  = lambda: curses.color_pair(6)
-MAG    = lambda: curses.color_pair(7)
-BLUE   = lambda: curses.color_pair(8)
+    GREEN  = curses.color_pair(1)
+    RED    = curses.color_pair(2)
+    CYAN   = curses.color_pair(3)
+    YELLOW = curses.color_pair(4)
+    DIM    = curses.color_pair(5)
+    WHITE  = curses.color_pair(6)
+    MAG    = curses.color_pair(7)
+    BLUE   = curses.color_pair(8)
 
 
 # ─── helpers ─────────────────────────────────────────────────────────────────
 
+# Local UTC offset in minutes — lets the fast path below convert the
+# backend's fixed "...Z" timestamps without datetime objects. Re-resolved at
+# most once a minute so a long-running monitor follows DST transitions, and
+# folded into the cache key so entries formatted with the old offset lapse.
+_local_off: list = [0, 0.0]  # [offset minutes, refresh deadline]
+
+
+def _local_offset_min() -> int:
+    now = time.time()
+    if now >= _local_off[1]:
+        _local_off[0] = int(
+            (datetime.now(timezone.utc).astimezone().utcoffset() or timedelta()).total_seconds() // 60
+        )
+        _local_off[1] = now + 60.0
+    return _local_off[0]
+
+
 def _fmt_ts(ts: Optional[str]) -> str:
+    return _fmt_ts_at(ts, _local_offset_min())
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_ts_at(ts: Optional[str], offset_min: int) -> str:
+    # Trade timestamps are immutable ISO strings that recur every render —
+    # cache the parsed/formatted result instead of re-running datetime+strftime
     if not ts:
         return ""
+    if len(ts) >= 20 and ts[10] == "T" and ts.endswith("Z"):
+        # Known UTC shape: slice the clock fields directly
+        try:
+            total = (int(ts[11:13]) * 60 + int(ts[14:16]) + offset_min) % 1440
+            hh, mm = divmod(total, 60)
+            return f"{(hh % 12) or 12:02d}:{mm:02d} {'AM' if hh < 12 else 'PM'}"
+        except ValueError:
+            pass
     try:
         dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
         return dt.astimezone().strftime("%I:%M %p")
@@ -65,8 +129,8 @@ def _fmt_ts(ts: Optional[str]) -> str:
         return ts[:16]
 
 
-def _fmt_dur(secs: float) -> str:
-    secs = int(secs)
+@functools.lru_cache(maxsize=4096)
+def _fmt_dur(secs: int) -> str:
     h, rem = divmod(secs, 3600)
     m, s   = divmod(rem, 60)
     if h:
@@ -76,6 +140,7 @@ def _fmt_dur(secs: float) -> str:
     return f"{s}s"
 
 
+@functools.lru_cache(maxsize=4096)
 def _compact(n: float) -> str:
     if abs(n) >= 1_000_000:
         return f"${n/1_000_000:.2f}M"
@@ -84,34 +149,79 @@ def _compact(n: float) -> str:
     return f"${n:,.2f}"
 
 
-def _query_gpus() -> list:
+GPU_QUERY_ARGS = [
+    "--query-gpu=index,name,temperature.gpu,fan.speed,utilization.gpu",
+    "--format=csv,noheader,nounits",
+]
+
+
+_nvml_ready = False
+
+
+def _query_gpus_nvml() -> Optional[list]:
+    """Sample GPU stats through NVML bindings (microseconds per call, no
+    fork/CSV parse). Returns None when NVML can't be used so the caller can
+    fall back to the nvidia-smi subprocess."""
+    global _nvml_ready
     try:
-        out = subprocess.run(
-            ["nvidia-smi",
-             "--query-gpu=index,name,temperature.gpu,fan.speed,utilization.gpu",
-             "--format=csv,noheader,nounits"],
-            capture_output=True, text=True, timeout=4,
-        )
-        if out.returncode != 0:
-            return []
+        if not _nvml_ready:
+            pynvml.nvmlInit()
+            _nvml_ready = True
         gpus = []
-        for line in out.stdout.strip().splitlines():
-            parts = [p.strip() for p in line.split(",")]
-            if len(parts) < 5:
-                continue
-            def sf(s):
-                try: return float(s)
-                except: return None
-            gpus.append({"index": int(parts[0]), "name": parts[1],
-                         "temp": sf(parts[2]), "fan": sf(parts[3]), "util": sf(parts[4])})
+        for i in range(pynvml.nvmlDeviceGetCount()):
+            h = pynvml.nvmlDeviceGetHandleByIndex(i)
+            name = pynvml.nvmlDeviceGetName(h)
+            if isinstance(name, bytes):
+                name = name.decode()
+            def sample(fn, *args):
+                try: return float(fn(*args))
+                except Exception: return None
+            gpus.append({
+                "index": i, "name": name,
+                "temp": sample(pynvml.nvmlDeviceGetTemperature, h, pynvml.NVML_TEMPERATURE_GPU),
+                "fan":  sample(pynvml.nvmlDeviceGetFanSpeed, h),
+                "util": sample(lambda hh: pynvml.nvmlDeviceGetUtilizationRates(hh).gpu, h),
+            })
         return gpus
     except Exception:
-        return []
+        return None
+
+
+def _gpu_poll_interval() -> float:
+    """Seconds between GPU samples. Temperature/fan/util move slowly, so the
+    default is 10s; overridable via PHANTOMEX_GPU_POLL_SECONDS, clamped to
+    >=1s (NVML itself only refreshes a few times a second)."""
+    try:
+        secs = float(os.environ.get("PHANTOMEX_GPU_POLL_SECONDS", 10))
+    except ValueError:
+        secs = 10.0
+    return max(1.0, secs)
+
+
+def _parse_gpu_line(line: str) -> Optional[dict]:
+    parts = [p.strip() for p in line.split(",")]
+    if len(parts) < 5:
+        return None
+    def sf(s):
+        try: return float(s)
+        except: return None
+    try:
+        idx = int(parts[0])
+    except ValueError:
+        return None
+    return {"index": idx, "name": parts[1],
+            "temp": sf(parts[2]), "fan": sf(parts[3]), "util": sf(parts[4])}
+
+
+# Only width+1 bar strings exist for the default width — build them once
+_BAR_CACHE = ["█" * i + "░" * (10 - i) for i in range(11)]
 
 
 def _bar(val, width=10):
     pct = max(0.0, min(1.0, val / 100.0))
     f = round(pct * width)
+    if width == 10:
+        return _BAR_CACHE[f]
     return "█" * f + "░" * (width - f)
 
 
@@ -143,85 +253,110 @@ def _hline(win, y, attr=0):
 
 # ─── draw functions ───────────────────────────────────────────────────────────
 
+# The header repaints every second for the clock; prices move far less
+# often, so the whole ticker row is kept as prebuilt (text, attr) spans and
+# only rebuilt when some symbol's (price, change) pair actually moves.
+_ticker_row: dict = {"key": None, "segments": ()}
+
+
+def _ticker_segments(prices: dict) -> tuple:
+    key = tuple(
+        (s, d.get("price", 0), d.get("change_24h", 0))
+        for s, d in list(prices.items())[:8]
+    )
+    if key != _ticker_row["key"]:
+        segs = []
+        for sym, price, chg in key:
+            arrow = "▲" if chg >= 0 else "▼"
+            segs.append((f" {sym} ${price:,.0f} ", curses.A_BOLD | WHITE))
+            segs.append((f"{arrow}{abs(chg):.1f}%  ", GREEN if chg >= 0 else RED))
+        _ticker_row["key"] = key
+        _ticker_row["segments"] = tuple(segs)
+    return _ticker_row["segments"]
+
+
 def draw_header(win, prices: dict, connected: bool):
     h, w = win.getmaxyx()
     win.erase()
 
     # Title
-    _put(win, 0, 0, " ⚡ PhantomEx Monitor", curses.A_BOLD | MAG())
+    _put(win, 0, 0, " ⚡ PhantomEx Monitor", curses.A_BOLD | MAG)
     # Clock
     clock = datetime.now().strftime("%I:%M:%S %p %Z")
-    _put(win, 0, w - len(clock) - 2, clock, DIM())
+    _put(win, 0, w - len(clock) - 2, clock, DIM)
     # Status dot
     status = "● LIVE" if connected else "○ ---"
-    sc = GREEN() if connected else RED()
+    sc = GREEN if connected else RED
     _put(win, 0, w - len(clock) - len(status) - 4, status, sc | curses.A_BOLD)
 
-    # Price ticker on row 1
+    # Price ticker on row 1 — prebuilt spans, one clipped addstr per span
     x = 1
-    for sym, data in list(prices.items())[:8]:
-        price = data.get("price", 0)
-        chg   = data.get("change_24h", 0)
-        arrow = "▲" if chg >= 0 else "▼"
-        col   = GREEN() if chg >= 0 else RED()
-        part  = f" {sym} ${price:,.0f} "
-        _put(win, 1, x, part, curses.A_BOLD | WHITE())
-        x += len(part)
-        pct = f"{arrow}{abs(chg):.1f}%  "
-        _put(win, 1, x, pct, col)
-        x += len(pct)
-        if x > w - 20:
+    for text, attr in _ticker_segments(prices):
+        if x + len(text) > w - 2:
             break
+        try:
+            win.addstr(1, x, text, attr)
+        except curses.error:
+            pass
+        x += len(text)
 
-    _hline(win, 2, DIM())
+    _hline(win, 2, DIM)
     win.noutrefresh()
 
 
+# GPU index -> vendor-stripped display name; names are immutable, so the two
+# .replace() scans run once per GPU per process instead of once per repaint
+_GPU_NAME_CACHE: dict = {}
+
+
 def draw_gpus(win, gpus: list):
     win.erase()
-    _put(win, 0, 0, " GPU STATUS", DIM() | curses.A_BOLD)
+    _put(win, 0, 0, " GPU STATUS", DIM | curses.A_BOLD)
 
     if not gpus:
-        _put(win, 1, 2, "nvidia-smi not available", DIM())
+        _put(win, 1, 2, "nvidia-smi not available", DIM)
     else:
         for i, g in enumerate(gpus):
             row = i + 1
-            name = g["name"].replace("NVIDIA GeForce ", "").replace("NVIDIA ", "")[:18]
+            name = _GPU_NAME_CACHE.get(g["index"])
+            if name is None:
+                name = g["name"].replace("NVIDIA GeForce ", "").replace("NVIDIA ", "")[:18]
+                _GPU_NAME_CACHE[g["index"]] = name
             temp = g["temp"]
             fan  = g["fan"]
             util = g["util"]
 
-            tc = GREEN() if (temp or 0) < 50 else YELLOW() if (temp or 0) < 75 else RED()
-            fc = CYAN()  if (fan  or 0) < 30 else YELLOW() if (fan  or 0) < 70 else RED()
+            tc = GREEN if (temp or 0) < 50 else YELLOW if (temp or 0) < 75 else RED
+            fc = CYAN  if (fan  or 0) < 30 else YELLOW if (fan  or 0) < 70 else RED
 
             x = 2
-            _put(win, row, x, f"GPU{g['index']} {name:<18}", curses.A_BOLD | WHITE())
+            _put(win, row, x, f"GPU{g['index']} {name:<18}", curses.A_BOLD | WHITE)
             x += 24
             t_str = f"{temp:.0f}°C" if temp is not None else "--°C"
-            _put(win, row, x, f"Temp ", DIM())
+            _put(win, row, x, f"Temp ", DIM)
             _put(win, row, x+5, f"{t_str} ", tc | curses.A_BOLD)
             _put(win, row, x+10, _bar(temp or 0), tc)
             x += 22
             f_str = f"{fan:.0f}%" if fan is not None else "--%"
-            _put(win, row, x, f"Fan ", DIM())
+            _put(win, row, x, f"Fan ", DIM)
             _put(win, row, x+4, f"{f_str} ", fc | curses.A_BOLD)
             _put(win, row, x+9, _bar(fan or 0), fc)
             x += 21
             u_str = f"{util:.0f}%" if util is not None else "--%"
-            _put(win, row, x, f"Load ", DIM())
-            _put(win, row, x+5, u_str, WHITE() | curses.A_BOLD)
+            _put(win, row, x, f"Load ", DIM)
+            _put(win, row, x+5, u_str, WHITE | curses.A_BOLD)
 
-    _hline(win, len(gpus) + 1 if gpus else 2, DIM())
+    _hline(win, len(gpus) + 1 if gpus else 2, DIM)
     win.noutrefresh()
 
 
-def draw_agents(win, agents: dict, prices: dict):
+def draw_agents(win, agents: dict, price_map: dict):
     win.erase()
     h, w = win.getmaxyx()
-    _put(win, 0, 0, " ACTIVE AGENTS", DIM() | curses.A_BOLD)
+    _put(win, 0, 0, " ACTIVE AGENTS", DIM | curses.A_BOLD)
 
     if not agents:
-        _put(win, 2, 2, "No agents deployed — visit the web UI to deploy one.", DIM())
+        _put(win, 2, 2, "No agents deployed — visit the web UI to deploy one.", DIM)
         win.noutrefresh()
         return
 
@@ -241,43 +376,47 @@ def draw_agents(win, agents: dict, prices: dict):
         started = a.get("started_at")
         max_dur = a.get("max_duration")
 
-        pc = GREEN() if pnl >= 0 else RED()
-        sc = GREEN() if running else DIM()
+        pc = GREEN if pnl >= 0 else RED
+        sc = GREEN if running else DIM
         dot = "●" if running else "○"
 
         # ── Row 1: name + meta ────────────────────────────────────────────
         _put(win, row, 1, dot, sc | curses.A_BOLD)
-        _put(win, row, 3, a.get("name", "?"), curses.A_BOLD | WHITE())
-        model = a.get("model", "").split(":")[0]
+        _put(win, row, 3, a.get("name", "?"), curses.A_BOLD | WHITE)
+        model = a.get("_model_short", "")
         x = 3 + len(a.get("name", "?")) + 1
-        _put(win, row, x, f" {model}", DIM())
+        _put(win, row, x, f" {model}", DIM)
         x += len(model) + 2
 
-        risk_col = RED() if risk == "aggressive" else GREEN() if risk == "safe" else YELLOW()
+        risk_col = RED if risk == "aggressive" else GREEN if risk == "safe" else YELLOW
         _put(win, row, x, f" [{risk}]", risk_col)
         x += len(risk) + 3
 
         if started:
-            elapsed = now - started
+            # int-quantized so the lru_cache keys on whole seconds
+            elapsed = int(now - started)
             if max_dur:
                 pct = elapsed / max_dur
-                tc = RED() if pct > 0.75 else YELLOW() if pct > 0.5 else DIM()
-                _put(win, row, x, f" ⏱ {_fmt_dur(elapsed)}/{_fmt_dur(max_dur)}", tc)
+                tc = RED if pct > 0.75 else YELLOW if pct > 0.5 else DIM
+                _put(win, row, x, f" ⏱ {_fmt_dur(elapsed)}/{_fmt_dur(int(max_dur))}", tc)
             else:
-                _put(win, row, x, f" ⏱ {_fmt_dur(elapsed)}", DIM())
+                _put(win, row, x, f" ⏱ {_fmt_dur(elapsed)}", DIM)
         row += 1
         if row >= h - 2:
             break
 
         # ── Row 2: portfolio stats ────────────────────────────────────────
-        _put(win, row, 4, "Portfolio ", DIM())
-        _put(win, row, 14, _compact(tv), WHITE() | curses.A_BOLD)
-        x = 14 + len(_compact(tv)) + 2
-        _put(win, row, x, "Cash ", DIM())
+        # Format each value once; the strings feed both _put and the x math
+        tv_s   = _compact(tv)
+        cash_s = _compact(cash)
+        _put(win, row, 4, "Portfolio ", DIM)
+        _put(win, row, 14, tv_s, WHITE | curses.A_BOLD)
+        x = 14 + len(tv_s) + 2
+        _put(win, row, x, "Cash ", DIM)
         x += 5
-        _put(win, row, x, _compact(cash), WHITE())
-        x += len(_compact(cash)) + 2
-        _put(win, row, x, "P&L ", DIM())
+        _put(win, row, x, cash_s, WHITE)
+        x += len(cash_s) + 2
+        _put(win, row, x, "P&L ", DIM)
         x += 4
         pnl_str = f"{'+' if pnl>=0 else ''}{_compact(pnl)}  ({'+' if ppc>=0 else ''}{ppc:.1f}%)"
         _put(win, row, x, pnl_str, pc | curses.A_BOLD)
@@ -288,27 +427,29 @@ def draw_agents(win, agents: dict, prices: dict):
         # ── Row 3: holdings ───────────────────────────────────────────────
         holdings = port.get("holdings", {})
         if holdings:
-            _put(win, row, 4, "Holdings ", DIM())
+            _put(win, row, 4, "Holdings ", DIM)
             x = 13
             for sym, h in list(holdings.items())[:6]:
                 qty      = h.get("quantity", 0)
                 avg      = h.get("avg_cost", 0)
-                lp       = prices.get(sym, {}).get("price", avg)
+                lp       = price_map.get(sym, avg)  # flat map: one lookup, no {} churn
                 pos_val  = qty * lp
                 cost_val = qty * avg
                 upnl     = pos_val - cost_val
                 upnl_pct = (upnl / cost_val * 100) if cost_val else 0
-                uc       = GREEN() if upnl >= 0 else RED()
+                uc       = GREEN if upnl >= 0 else RED
                 sign     = "+" if upnl >= 0 else ""
-                chunk    = f"{sym} {qty:.4g} ≈{_compact(pos_val)} {sign}{upnl_pct:.1f}%   "
-                if x + len(chunk) > w - 2:
-                    break
-                _put(win, row, x, sym + " ", CYAN() | curses.A_BOLD)
-                _put(win, row, x + len(sym) + 1, f"{qty:.4g} ", WHITE())
-                _put(win, row, x + len(sym) + len(f"{qty:.4g}") + 2, f"≈{_compact(pos_val)} ", DIM())
+                qty_s    = f"{qty:.4g}"
+                pv_s     = f"≈{_compact(pos_val)} "
                 pct_str  = f"{sign}{upnl_pct:.1f}%   "
-                _put(win, row, x + len(sym) + len(f"{qty:.4g}") + 2 + len(f"≈{_compact(pos_val)} "), pct_str, uc)
-                x += len(chunk)
+                chunk_len = len(sym) + len(qty_s) + len(pv_s) + len(pct_str) + 2
+                if x + chunk_len > w - 2:
+                    break
+                _put(win, row, x, sym + " ", CYAN | curses.A_BOLD)
+                _put(win, row, x + len(sym) + 1, qty_s + " ", WHITE)
+                _put(win, row, x + len(sym) + len(qty_s) + 2, pv_s, DIM)
+                _put(win, row, x + len(sym) + len(qty_s) + 2 + len(pv_s), pct_str, uc)
+                x += chunk_len
             row += 1
             if row >= h - 2:
                 break
@@ -317,7 +458,7 @@ def draw_agents(win, agents: dict, prices: dict):
         thought = a.get("last_thought")
         if thought:
             act  = thought.get("action", "hold")
-            ac   = GREEN() if act == "buy" else RED() if act == "sell" else DIM()
+            ac   = GREEN if act == "buy" else RED if act == "sell" else DIM
             sym_q = ""
             if thought.get("symbol") and act != "hold":
                 sym_q = f" {thought['symbol']} ×{thought.get('quantity','')}"
@@ -326,35 +467,43 @@ def draw_agents(win, agents: dict, prices: dict):
             avail  = w - 6
             rsn    = rsn[:avail] + ("…" if len(rsn) > avail else "")
 
-            _put(win, row, 4, "└ ", DIM())
+            _put(win, row, 4, "└ ", DIM)
             _put(win, row, 6, act.upper(), ac | curses.A_BOLD)
             x = 6 + len(act)
-            _put(win, row, x, sym_q, WHITE())
+            _put(win, row, x, sym_q, WHITE)
             x += len(sym_q)
-            _put(win, row, x, f"  {ts_str}", DIM())
+            _put(win, row, x, f"  {ts_str}", DIM)
             row += 1
             if row < h - 2 and rsn:
-                _put(win, row, 6, rsn, DIM())
+                _put(win, row, 6, rsn, DIM)
                 row += 1
         else:
-            _put(win, row, 4, "└ idle", DIM())
+            _put(win, row, 4, "└ idle", DIM)
             row += 1
 
         # spacer between agents
         row += 1
 
-    _hline(win, h - 1, DIM())
+    _hline(win, h - 1, DIM)
     win.noutrefresh()
 
 
 def draw_trades(win, trades: list):
     win.erase()
     h, w = win.getmaxyx()
-    _put(win, 0, 0, " RECENT TRADES", DIM() | curses.A_BOLD)
-
-    shown = [t for t in trades if t.get("side") != "hold"][:h - 2]
+    _put(win, 0, 0, " RECENT TRADES", DIM | curses.A_BOLD)
+
+    # Single pass with early exit — don't scan all 200 entries to fill a
+    # panel that can show h-2 rows
+    cap = h - 2
+    shown = []
+    for t in trades:
+        if t.get("side") != "hold":
+            shown.append(t)
+            if len(shown) >= cap:
+                break
     if not shown:
-        _put(win, 1, 2, "No trades yet.", DIM())
+        _put(win, 1, 2, "No trades yet.", DIM)
         win.noutrefresh()
         return
 
@@ -362,22 +511,23 @@ def draw_trades(win, trades: list):
     for t in shown:
         if row >= h - 1:
             break
-        side  = t.get("side", "hold")
-        sc    = GREEN() if side == "buy" else RED()
-        sym   = t.get("symbol") or "—"
-        qty   = t.get("quantity", 0)
-        price = t.get("price", 0)
-        total = t.get("total", 0)
-        ts    = _fmt_ts(t.get("timestamp"))
-        agent = (t.get("agent_name") or t.get("agent_id","?"))[:12]
-
-        _put(win, row, 1, f"{ts:<10}", DIM())
-        _put(win, row, 12, f"{agent:<13}", WHITE())
+        get   = t.get  # hot row loop — bind the method once
+        side  = get("side", "hold")
+        sc    = GREEN if side == "buy" else RED
+        sym   = get("symbol") or "—"
+        qty   = get("quantity", 0)
+        price = get("price", 0)
+        total = get("total", 0)
+        ts    = _fmt_ts(get("timestamp"))
+        agent = t["agent_name"][:12]  # always set at ingestion
+
+        # Column widths are fixed, so the plain-attr spans either side of the
+        # colored side/symbol tokens fold into one _put each: 4 curses calls
+        # per row instead of 7
+        _put(win, row, 1, f"{ts:<11}{agent:<13}", DIM)
         _put(win, row, 26, f"{side.upper():<5}", sc | curses.A_BOLD)
-        _put(win, row, 32, f"{sym:<5}", CYAN() | curses.A_BOLD)
-        _put(win, row, 38, f"{qty:.4f}", WHITE())
-        _put(win, row, 48, f"@ ${price:,.2f}", DIM())
-        _put(win, row, 62, f"= {_compact(total)}", WHITE())
+        _put(win, row, 32, f"{sym:<5}", CYAN | curses.A_BOLD)
+        _put(win, row, 38, f"{qty:<10.4f}{f'@ ${price:,.2f}':<14}= {_compact(total)}", WHITE)
         row += 1
 
     win.noutrefresh()
@@ -388,123 +538,353 @@ def draw_trades(win, trades: list):
 class State:
     def __init__(self):
         self.prices:      dict  = {}
+        self.price_map:   dict  = {}  # sym -> price only, for holdings valuation
         self.agents:      dict  = {}
         self.agent_names: dict  = {}
-        self.trades:      list  = []
+        self.trades:      deque = deque(maxlen=200)  # newest first, auto-trimmed
         self.gpus:        list  = []
         self.connected:   bool  = False
-        self.lock = threading.Lock()
+        self.dirty = asyncio.Event()  # set by mutators; wakes redraw_loop
+
+
+# Last-drawn signature per panel — lets redraw() skip panels whose inputs
+# didn't change since the previous frame instead of erasing + repainting all
+# four every 0.5s. Signatures include the layout tuple so a resize (or a
+# panel growing/shrinking) repaints everything.
+_panel_sigs: dict = {}
+
+# derwin() allocates a curses WINDOW every call, so the four subwindows are
+# cached and only recreated when the layout tuple changes (terminal resize,
+# GPU count change, or the trades panel growing/shrinking)
+_win_cache: dict = {"key": None, "wins": ()}
 
 
 def redraw(stdscr, state: State):
-    """Partition terminal and redraw all panels."""
+    """Partition terminal and redraw the panels whose data changed."""
     h, w = stdscr.getmaxyx()
-    state_copy = (state.prices.copy(), state.agents.copy(),
-                  state.trades[:], state.gpus[:], state.connected)
-    prices, agents, trades, gpus, connected = state_copy
-
-    # Heights
+    # redraw() is synchronous and every mutator is a task on the same event
+    # loop, so nothing can touch State mid-draw — reference, don't copy
+    prices, agents, gpus, connected = (
+        state.prices, state.agents, state.gpus, state.connected)
+    trades = list(state.trades)  # deque doesn't slice; draw_trades needs one
+
+    # Heights — the trade count saturates at 10 (panel caps at 12 rows), so
+    # stop counting there instead of filtering the whole log
+    n_shown = 0
+    for t in trades:
+        if t.get("side") != "hold":
+            n_shown += 1
+            if n_shown >= 10:
+                break
     hdr_h   = 3
     gpu_h   = max(3, len(gpus) + 2) if gpus else 3
-    trade_h = min(12, max(4, len([t for t in trades if t.get("side") != "hold"]) + 2))
+    trade_h = min(12, max(4, n_shown + 2))
     agent_h = max(4, h - hdr_h - gpu_h - trade_h)
 
-    row = 0
-    hdr_win   = stdscr.derwin(hdr_h,   w, row, 0); row += hdr_h
-    gpu_win   = stdscr.derwin(gpu_h,   w, row, 0); row += gpu_h
-    agent_win = stdscr.derwin(agent_h, w, row, 0); row += agent_h
-    trade_win = stdscr.derwin(trade_h, w, row, 0)
+    # Change signatures. The header clock and agent ⏱ timers tick once per
+    # second, so those panels fold int(now) into their signature; repr() is a
+    # cheap deep fingerprint compared to a full curses repaint.
+    now = time.time()
+    prices_sig = repr(prices)
+    layout = (h, w, hdr_h, gpu_h, agent_h, trade_h)
+    timers = any(a.get("started_at") for a in agents.values())
+    sigs = {
+        "header": (layout, prices_sig, connected, int(now)),
+        "gpus":   (layout, repr(gpus)),
+        "agents": (layout, repr(agents), prices_sig, int(now) if timers else 0),
+        "trades": (layout, repr(trades)),
+    }
+
+    if _win_cache["key"] != layout:
+        stdscr.erase()  # clear artifacts left by the previous partition
+        stdscr.noutrefresh()
+        # The fresh windows are blank, so every panel must repaint even if
+        # its data signature still matches (e.g. SIGWINCH with an unchanged
+        # layout, where the erase just wiped the old content)
+        _panel_sigs.clear()
+        row = 0
+        hdr_win   = stdscr.derwin(hdr_h,   w, row, 0); row += hdr_h
+        gpu_win   = stdscr.derwin(gpu_h,   w, row, 0); row += gpu_h
+        agent_win = stdscr.derwin(agent_h, w, row, 0); row += agent_h
+        trade_win = stdscr.derwin(trade_h, w, row, 0)
+        _win_cache["key"] = layout
+        _win_cache["wins"] = (hdr_win, gpu_win, agent_win, trade_win)
+    else:
+        hdr_win, gpu_win, agent_win, trade_win = _win_cache["wins"]
 
-    draw_header(hdr_win,   prices,  connected)
-    draw_gpus  (gpu_win,   gpus)
-    draw_agents(agent_win, agents,  prices)
-    draw_trades(trade_win, trades)
+    drew = False
+    for key, win, fn, args in (
+        ("header", hdr_win,   draw_header, (prices, connected)),
+        ("gpus",   gpu_win,   draw_gpus,   (gpus,)),
+        ("agents", agent_win, draw_agents, (agents, state.price_map)),
+        ("trades", trade_win, draw_trades, (trades,)),
+    ):
+        if _panel_sigs.get(key) != sigs[key]:
+            fn(win, *args)
+            _panel_sigs[key] = sigs[key]
+            drew = True
 
-    curses.doupdate()
+    if drew:
+        curses.doupdate()
 
 
 async def gpu_loop(state: State):
+    """Stream samples from one long-lived `nvidia-smi -lms` process.
+
+    NVML re-initialization dominates the cost of a one-shot nvidia-smi call,
+    so instead of forking every 5s the loop spawns a single looping process
+    and reads CSV rows as they arrive; rows are batched into a snapshot each
+    time the GPU index wraps back to 0. On EOF or spawn failure the process
+    is respawned with exponential backoff, and machines without nvidia-smi
+    never poll at all. When pynvml is installed the loop samples NVML
+    in-process instead — no subprocess at all.
+    """
+    interval = _gpu_poll_interval()
+    if pynvml is not None:
+        idle_streak = 0
+        while True:
+            gpus = _query_gpus_nvml()
+            if gpus is None:
+                break  # NVML unusable — fall through to the subprocess path
+            if gpus != state.gpus:  # idle GPUs repeat samples; skip the churn
+                state.gpus = gpus
+                state.dirty.set()
+            # GPUs that have sat at 0% util for a while aren't about to get
+            # interesting — stretch the poll 3x until load reappears
+            if gpus and all((g["util"] or 0) == 0 for g in gpus):
+                idle_streak += 1
+            else:
+                idle_streak = 0
+            await asyncio.sleep(interval * (3 if idle_streak > 6 else 1))
+    if shutil.which("nvidia-smi") is None:
+        return  # no NVIDIA stack — the panel shows "not available"; don't fork
+    backoff = interval
     while True:
-        gpus = await asyncio.get_event_loop().run_in_executor(None, _query_gpus)
-        with state.lock:
-            state.gpus = gpus
-        await asyncio.sleep(5)
+        streamed = False
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "nvidia-smi", *GPU_QUERY_ARGS, "-lms", str(int(interval * 1000)),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except (FileNotFoundError, OSError):
+            proc = None
+        if proc is not None:
+            batch: list = []
+            try:
+                while True:
+                    line = await proc.stdout.readline()
+                    if not line:
+                        break  # process died — respawn
+                    g = _parse_gpu_line(line.decode("utf-8", "replace"))
+                    if g is None:
+                        continue
+                    if g["index"] == 0 and batch:
+                        if batch != state.gpus:
+                            state.gpus = batch
+                            state.dirty.set()
+                        streamed = True
+                        batch = []
+                    batch.append(g)
+            finally:
+                if proc.returncode is None:
+                    proc.kill()
+        if streamed:
+            backoff = interval
+        else:
+            # never produced a sample (driver broken, container without NVML):
+            # interval → 2x → ... → 10 min, so a dead stack doesn't burn wakeups
+            state.gpus = []
+            state.dirty.set()
+            backoff = min(backoff * 2, 600.0)
+        await asyncio.sleep(backoff)
 
 
-async def ws_loop(state: State):
-    http_base = HTTP_URL
+def _ingest_agent(state: State, ag: dict) -> None:
+    """Register an agent dict, precomputing render-only derived fields once
+    per message instead of on every frame."""
+    aid = ag["id"]
+    ag["_model_short"] = ag.get("model", "").partition(":")[0]  # no list alloc
+    state.agents[aid] = ag
+    state.agent_names[aid] = ag.get("name") or aid[:8]  # never empty
+
+
+# Per-type message handlers. No locking anywhere: every mutator and redraw()
+# runs as a coroutine on the one event loop and none of them await
+# mid-mutation, so cooperative scheduling already serializes access to State.
+
+def _h_snapshot(state: State, msg: dict) -> None:
+    state.prices = msg["prices"]
+    state.price_map = {s: d.get("price", 0) for s, d in state.prices.items()}
+    for ag in msg["agents"]:
+        _ingest_agent(state, ag)
+    seed = msg.get("trades", [])
+    for tr in seed:
+        aid = tr.get("agent_id", "")
+        tr["agent_name"] = state.agent_names.get(aid) or aid[:8]
+    state.trades = deque(seed[:200], maxlen=200)
+
+
+def _prices_unmoved(new: dict, old: dict) -> bool:
+    # Every symbol dict carries a fresh per-tick timestamp, so whole-dict
+    # equality never holds; only the fields the panels render matter
+    if new.keys() != old.keys():
+        return False
+    for s, d in new.items():
+        o = old[s]
+        if d.get("price") != o.get("price") or d.get("change_24h") != o.get("change_24h"):
+            return False
+    return True
+
+
+def _h_prices(state: State, msg: dict) -> None:
+    # Keyframes repeat unchanged data between moves — don't touch state
+    # (and the header's change signature) unless something actually moved
+    if not _prices_unmoved(msg["data"], state.prices):
+        state.prices = msg["data"]
+        state.price_map = {s: d.get("price", 0) for s, d in state.prices.items()}
+
+
+def _h_prices_delta(state: State, msg: dict) -> None:
+    state.prices.update(msg["data"])
+    for s, d in msg["data"].items():
+        state.price_map[s] = d.get("price", 0)
+
+
+def _h_agent_state(state: State, msg: dict) -> None:
+    _ingest_agent(state, msg["data"])
+
+
+def _h_agent_removed(state: State, msg: dict) -> None:
+    state.agents.pop(msg.get("agent_id", ""), None)
+
+
+def _h_trade(state: State, msg: dict) -> None:
+    tr  = msg["data"]
+    aid = tr.get("agent_id", "")
+    tr["agent_name"] = state.agent_names.get(aid) or aid[:8]
+    state.trades.appendleft(tr)  # maxlen trims the tail
+
+
+def _h_portfolio(state: State, msg: dict) -> None:
+    aid = msg.get("agent_id")
+    if aid and aid in state.agents:
+        state.agents[aid]["portfolio"] = msg["data"]
+
+
+HANDLERS = {
+    "snapshot":      _h_snapshot,
+    "prices":        _h_prices,
+    "prices_delta":  _h_prices_delta,
+    "agent_state":   _h_agent_state,
+    "agent_removed": _h_agent_removed,
+    "trade":         _h_trade,
+    "portfolio":     _h_portfolio,
+}
+
+
+def _apply_message(state: State, msg: dict) -> None:
+    # One dict probe instead of walking an if/elif type chain per message
+    handler = HANDLERS.get(msg.get("type"))
+    if handler is not None:
+        handler(state, msg)
+
+
+MSG_QUEUE_MAX = 1000
+
+# Frames above this parse in a worker thread. Only the connect snapshot
+# (prices + agents + the full trade seed) gets near it; everyday ticks and
+# trades parse inline without paying the thread hop.
+PARSE_OFFLOAD_BYTES = 64 * 1024
+
+
+async def msg_loop(state: State, queue: asyncio.Queue):
+    """Drain raw frames off the queue and apply them to State."""
     while True:
-        # Seed from REST
+        raw = await queue.get()
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                a_resp = await client.get(f"{http_base}/api/agents")
-                with state.lock:
-                    for a in a_resp.json():
-                        aid = a.get("id", "")
-                        state.agents[aid] = a
-                        state.agent_names[aid] = a.get("name", aid[:8])
-
-                t_resp = await client.get(f"{http_base}/api/trades?limit=60")
-                raw = t_resp.json()
-                with state.lock:
-                    for t in raw:
-                        aid = t.get("agent_id", "")
-                        t["agent_name"] = state.agent_names.get(aid, aid[:8])
-                    state.trades = sorted(raw, key=lambda x: x.get("timestamp",""), reverse=True)
+            if len(raw) > PARSE_OFFLOAD_BYTES:
+                msg = await asyncio.to_thread(_loads, raw)
+            else:
+                msg = _loads(raw)
+            _apply_message(state, msg)
         except Exception:
-            pass
+            pass  # malformed frame — keep consuming
+        else:
+            state.dirty.set()
 
-        # Open WS
+
+async def ws_loop(state: State, queue: asyncio.Queue):
+    http_base = HTTP_URL
+    backoff = 1.0
+    while True:
+        # No REST seeding — the server's snapshot frame carries prices,
+        # agents and seed trades on the websocket we open anyway
         try:
+            # Compression is off by default — the usual deployment is
+            # localhost, where deflating frames just burns CPU on both ends.
+            # Remote monitors can opt in (repeated JSON field names compress
+            # well) via PHANTOMEX_WS_COMPRESSION=deflate.
+            compression = (
+                "deflate"
+                if os.environ.get("PHANTOMEX_WS_COMPRESSION") == "deflate"
+                else None
+            )
             async with websockets.connect(
-                f"{http_base.replace('http','ws')}/ws", open_timeout=5
+                f"{http_base.replace('http','ws')}/ws", open_timeout=5,
+                compression=compression, max_size=2**20,
             ) as ws:
-                with state.lock:
-                    state.connected = True
+                state.connected = True
+                state.dirty.set()
+                backoff = 1.0
+                # Reads only enqueue — parsing/apply happens in msg_loop, so
+                # a processing stall never backs up into the socket buffer.
+                # Drop-oldest under overflow: the UI wants latest state.
                 async for raw in ws:
-                    msg = json.loads(raw)
-                    t   = msg.get("type")
-                    with state.lock:
-                        if t == "prices":
-                            state.prices = msg["data"]
-                        elif t == "agent_state":
-                            ag  = msg["data"]
-                            aid = ag["id"]
-                            state.agents[aid] = ag
-                            state.agent_names[aid] = ag.get("name", aid[:8])
-                        elif t == "agent_removed":
-                            state.agents.pop(msg.get("agent_id",""), None)
-                        elif t == "trade":
-                            tr  = msg["data"]
-                            aid = tr.get("agent_id","")
-                            tr["agent_name"] = state.agent_names.get(aid, aid[:8])
-                            state.trades.insert(0, tr)
-                            state.trades = state.trades[:200]
-                        elif t == "portfolio":
-                            aid = msg.get("agent_id")
-                            if aid and aid in state.agents:
-                                state.agents[aid]["portfolio"] = msg["data"]
+                    if queue.full():
+                        try:
+                            queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            pass
+                    queue.put_nowait(raw)
         except Exception:
-            with state.lock:
-                state.connected = False
-            await asyncio.sleep(3)
+            state.connected = False
+            state.dirty.set()
+            # Exponential backoff with jitter: a dead server isn't hammered
+            # every 3s, and a fleet of monitors doesn't reconnect in lockstep
+            await asyncio.sleep(min(60.0, backoff) * (0.5 + random.random()))
+            backoff *= 2
 
 
 async def redraw_loop(stdscr, state: State):
+    """Redraw when state changes, with a 1s floor so the clock still ticks.
+
+    Between trades nothing mutates for seconds at a time — waiting on the
+    dirty event instead of polling every 0.5s drops idle CPU to the once-a-
+    second clock repaint, while a burst of messages still lands within one
+    frame. The short sleep before clearing coalesces back-to-back frames
+    (price tick + trade + portfolio) into a single repaint.
+    """
     while True:
-        with state.lock:
-            try:
-                redraw(stdscr, state)
-            except Exception:
-                pass
-        await asyncio.sleep(0.5)
+        try:
+            await asyncio.wait_for(state.dirty.wait(), timeout=1.0)
+            await asyncio.sleep(0.05)
+            state.dirty.clear()
+        except asyncio.TimeoutError:
+            pass  # idle — fall through so the header clock advances
+        try:
+            redraw(stdscr, state)
+        except Exception:
+            pass
+
+
+QUIT_KEYS = (ord('q'), ord('Q'), 27)  # ESC = 27
 
 
 async def input_loop(stdscr):
-    """Non-blocking key reader — returns when Q/ESC pressed."""
+    """Polling key reader — fallback for loops without add_reader support."""
     while True:
-        key = stdscr.getch()
-        if key in (ord('q'), ord('Q'), 27):  # ESC = 27
+        if stdscr.getch() in QUIT_KEYS:
             return
         await asyncio.sleep(0.05)
 
@@ -519,16 +899,54 @@ def run(stdscr):
     state = State()
 
     async def main():
+        loop = asyncio.get_running_loop()
+        msg_queue: asyncio.Queue = asyncio.Queue(maxsize=MSG_QUEUE_MAX)
+        quit_ev = asyncio.Event()
+
+        def _on_key():
+            if stdscr.getch() in QUIT_KEYS:
+                quit_ev.set()
+
+        # Wake on actual keypresses instead of polling getch() at 20 Hz;
+        # fall back to the polling loop where add_reader isn't supported
+        stdin_fd: Optional[int] = sys.stdin.fileno()
+        try:
+            loop.add_reader(stdin_fd, _on_key)
+            input_task = asyncio.create_task(quit_ev.wait())
+        except (NotImplementedError, OSError):
+            stdin_fd = None
+            input_task = asyncio.create_task(input_loop(stdscr))
+
+        # Resize: update curses' screen dimensions right away and invalidate
+        # the cached subwindows so the next frame repartitions cleanly,
+        # instead of waiting for a redraw to notice the new getmaxyx
+        if hasattr(signal, "SIGWINCH"):
+            def _on_winch():
+                try:
+                    curses.update_lines_cols()
+                    curses.resizeterm(curses.LINES, curses.COLS)
+                except curses.error:
+                    pass
+                _win_cache["key"] = None
+                state.dirty.set()
+            try:
+                loop.add_signal_handler(signal.SIGWINCH, _on_winch)
+            except (NotImplementedError, RuntimeError):
+                pass  # loops without signal support fall back to polling
+
         tasks = [
-            asyncio.create_task(ws_loop(state)),
+            asyncio.create_task(ws_loop(state, msg_queue)),
+            asyncio.create_task(msg_loop(state, msg_queue)),
             asyncio.create_task(gpu_loop(state)),
             asyncio.create_task(redraw_loop(stdscr, state)),
-            asyncio.create_task(input_loop(stdscr)),
+            input_task,
         ]
-        # Exit when input_loop finishes (Q or ESC)
+        # Exit when the key handler fires (Q or ESC)
         done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
         for t in pending:
             t.cancel()
+        if stdin_fd is not None:
+            loop.remove_reader(stdin_fd)
 
     asyncio.run(main())
 
@@ -542,6 +960,8 @@ def main():
             HTTP_URL = arg.replace("ws://", "http://").rstrip("/ws").rstrip("/")
         elif arg.startswith("http://"):
             HTTP_URL = arg.rstrip("/")
+    if uvloop is not None:
+        uvloop.install()  # picked up by the asyncio.run inside run()
     curses.wrapper(run)
 
 
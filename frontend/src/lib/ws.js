@@ -47,10 +47,22 @@ function dispatch(msg) {
   if (listeners[t]) listeners[t].forEach(fn => fn(msg))
 
   switch (t) {
+    case 'snapshot':
+      // Initial state on connect, bundled into a single frame
+      prices.set(msg.prices)
+      agents.set(Object.fromEntries(msg.agents.map(a => [a.id, a])))
+      if (msg.trades) trades.set(msg.trades.filter(afterWipe))
+      break
+
     case 'prices':
       prices.set(msg.data)
       break
 
+    case 'prices_delta':
+      // Only the symbols that moved this tick; merge into the last snapshot
+      prices.update(p => ({ ...p, ...msg.data }))
+      break
+
     case 'agent_state': {
       const prev = get(agents)
       const isNew = !prev[msg.data.id]
@@ -116,23 +128,19 @@ function send(msg) {
 
 function connect() {
   socket = new WebSocket(WS_URL)
+  // Server sends binary frames (skips UTF-8 text framing); decode ourselves
+  socket.binaryType = 'arraybuffer'
 
-  socket.onopen = async () => {
+  socket.onopen = () => {
     connected.set(true)
     console.log('[ws] Connected to PhantomEx')
-    // Seed historical trade log from REST so log is never empty on page load
-    try {
-      const res = await fetch('/api/trades?limit=500')
-      const data = await res.json()
-      trades.set(data.filter(afterWipe))
-    } catch (e) {
-      console.warn('[ws] Could not seed trade history', e)
-    }
+    // Trade history arrives in the server's snapshot frame — no REST seed
   }
 
   socket.onmessage = (e) => {
     try {
-      dispatch(JSON.parse(e.data))
+      const raw = typeof e.data === 'string' ? e.data : new TextDecoder().decode(e.data)
+      dispatch(JSON.parse(raw))
     } catch (err) {
       console.error('[ws] Parse error', err)
     }
@@ -58,4 +58,7 @@ cd "$BACKEND"
 exec "$ROOT/venv/bin/uvicorn" main:app \
   --host 0.0.0.0 \
   --port "$PORT" \
+  --loop uvloop \
+  --http httptools \
+  --ws websockets \
   --reload